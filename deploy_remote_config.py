@@ -4,11 +4,13 @@ Firebase Remote Config Deployment Script
 Amazon Rewards ve Points sistemi için Remote Config parametrelerini yükler
 """
 
-import json
 import sys
 import subprocess
 import os
 from pathlib import Path
+from remote_config_loader import dump_template, iter_parameters, load_section, load_template
+from remote_config_model import Parameter, Template, json_default
+from remote_config_validation import print_errors, validate_template
 
 def get_firebase_access_token():
     """Firebase access token'ı al"""
@@ -34,39 +36,31 @@ def get_firebase_access_token():
 
 def merge_remote_config(current_config_path, new_config_path, output_path):
     """Mevcut ve yeni Remote Config'i birleştir"""
-    # Mevcut config'i yükle
-    if os.path.exists(current_config_path):
-        with open(current_config_path, 'r', encoding='utf-8') as f:
-            current_config = json.load(f)
+    # Mevcut config'i yükle (tek kopya, birleştirme bunun üzerinde yapılır)
+    if current_config_path and os.path.exists(current_config_path):
+        current_config = Template.from_json(load_template(current_config_path))
     else:
-        current_config = {"parameters": {}}
+        current_config = Template.from_json({"parameters": {}})
     
-    # Yeni config'i yükle
-    with open(new_config_path, 'r', encoding='utf-8') as f:
-        new_config = json.load(f)
-    
-    # Parametreleri birleştir (yeni parametreler mevcutları günceller)
-    merged_parameters = current_config.get("parameters", {}).copy()
-    merged_parameters.update(new_config.get("parameters", {}))
+    # Yeni parametreleri tek tek uygula (yeni parametreler mevcutları günceller)
+    merged_config = current_config.with_parameters({
+        key: Parameter.from_json(param) for key, param in iter_parameters(new_config_path)
+    })
     
     # Birleştirilmiş config
-    merged_config = {
-        "parameters": merged_parameters,
-        "version": new_config.get("version", {
-            "versionNumber": "1",
-            "updateTime": "2025-01-20T00:00:00Z",
-            "updateUser": {
-                "email": "qanta@remote-config.com"
-            },
-            "description": "Amazon Rewards ve Points sistemi için Remote Config ayarları",
-            "updateOrigin": "REST_API",
-            "updateType": "INCREMENTAL_UPDATE"
-        })
-    }
+    merged_config = merged_config.replace(version=None).with_version(**load_section(new_config_path, "version", {
+        "versionNumber": "1",
+        "updateTime": "2025-01-20T00:00:00Z",
+        "updateUser": {
+            "email": "qanta@remote-config.com"
+        },
+        "description": "Amazon Rewards ve Points sistemi için Remote Config ayarları",
+        "updateOrigin": "REST_API",
+        "updateType": "INCREMENTAL_UPDATE"
+    }))
     
     # Kaydet
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(merged_config, f, indent=2, ensure_ascii=False)
+    dump_template(merged_config, output_path, default=json_default)
     
     print(f"✅ Birleştirilmiş config kaydedildi: {output_path}")
     return merged_config
@@ -110,18 +104,24 @@ def main():
     )
     
     # Parametre sayısı
-    param_count = len(merged_config.get("parameters", {}))
+    param_count = len(merged_config.parameters)
     print(f"📊 Toplam parametre sayısı: {param_count}")
     print()
     
+    # Değerleri doğrula
+    errors = validate_template(merged_config)
+    if errors:
+        print_errors(errors)
+        print("   Yayınlamadan önce remote_config_merged.json dosyasını düzeltin")
+        print()
+    
     # Yeni parametreleri listele
     if current_config_path and current_config_path.exists():
-        with open(current_config_path, 'r', encoding='utf-8') as f:
-            current_params = set(json.load(f).get("parameters", {}).keys())
+        current_params = {key for key, _ in iter_parameters(current_config_path)}
     else:
         current_params = set()
     
-    new_params = set(merged_config.get("parameters", {}).keys())
+    new_params = set(merged_config.parameters)
     added_params = new_params - current_params
     
     if added_params:
@@ -9,7 +9,8 @@ import subprocess
 import sys
 import os
 from pathlib import Path
-import requests
+from remote_config_metrics import start_run
+from remote_config_publish import publish_all
 
 def get_firebase_project_id():
     """Project ID'yi .firebaserc'den al"""
@@ -57,58 +58,24 @@ def get_firebase_access_token():
     print('   3. Veya Firebase Console\'dan 1 parametre ekle, sonra script\'i çalıştır')
     return None
 
-def get_current_template(project_id, access_token):
-    """Mevcut Remote Config template'ini al"""
-    url = f'https://firebaseremoteconfig.googleapis.com/v1/projects/{project_id}/remoteConfig'
-    headers = {
-        'Authorization': f'Bearer {access_token}',
-        'Content-Type': 'application/json',
-    }
-    
-    response = requests.get(url, headers=headers)
-    
-    if response.status_code == 200:
-        return response.json(), response.headers.get('ETag')
-    elif response.status_code == 404:
-        print('❌ Remote Config template bulunamadı')
-        print('   Firebase Console\'dan en az bir parametre ekleyin')
-        return None, None
-    else:
-        print(f'❌ Template alınamadı: HTTP {response.status_code}')
-        print(f'   Response: {response.text}')
-        return None, None
-
-def deploy_template(project_id, access_token, template, etag):
-    """Remote Config template'ini yükle"""
-    url = f'https://firebaseremoteconfig.googleapis.com/v1/projects/{project_id}/remoteConfig'
-    headers = {
-        'Authorization': f'Bearer {access_token}',
-        'Content-Type': 'application/json',
-        'If-Match': etag,
-    }
-    
-    response = requests.put(url, headers=headers, json=template)
-    
-    if response.status_code == 200:
-        return response.json()
-    else:
-        print(f'❌ Template yüklenemedi: HTTP {response.status_code}')
-        print(f'   Response: {response.text}')
-        return None
-
 def main():
     print('🚀 Firebase Remote Config Deployment')
     print('=' * 60)
     print()
     
+    # Metrikler çıkışta .remote_config_metrics.db'ye yazılır
+    metrics = start_run('deploy_remote_config_final')
+    
     # Project ID al
     project_id = get_firebase_project_id()
+    metrics.project = project_id
     print(f'📋 Project ID: {project_id}')
     print()
     
     # Access token al
     print('🔐 Access token alınıyor...')
-    access_token = get_firebase_access_token()
+    with metrics.phase('auth'):
+        access_token = get_firebase_access_token()
     
     if not access_token:
         print('\n💡 Alternatif Yöntem:')
@@ -127,79 +94,20 @@ def main():
         print('   Önce deploy_remote_config.py scriptini çalıştırın')
         sys.exit(1)
     
-    with open(config_path, 'r') as f:
-        new_config = json.load(f)
-    
-    print(f'📖 Config dosyası okundu: {config_path}')
-    print(f'   Yeni parametre sayısı: {len(new_config.get("parameters", {}))}')
-    print()
-    
-    # Mevcut template'i al
-    print('📥 Mevcut Remote Config template alınıyor...')
-    current_template, etag = get_current_template(project_id, access_token)
-    
-    if not current_template:
-        sys.exit(1)
-    
-    print('✅ Mevcut template alındı')
-    print(f'   Mevcut parametre sayısı: {len(current_template.get("parameters", {}))}')
-    print(f'   ETag: {etag}')
+    print(f'📖 Config dosyası: {config_path}')
     print()
     
-    # Parametreleri birleştir
-    print('🔀 Parametreler birleştiriliyor...')
-    merged_parameters = current_template.get('parameters', {}).copy()
-    new_parameters = new_config.get('parameters', {})
-    
-    added_count = 0
-    updated_count = 0
-    
-    for key, param_config in new_parameters.items():
-        defaultValue = param_config.get('defaultValue', {}).get('value')
-        valueType = param_config.get('valueType', 'STRING')
-        description = param_config.get('description', '')
-        
-        if not defaultValue and defaultValue != '0' and defaultValue != '':
-            continue
-        
-        if key in merged_parameters:
-            merged_parameters[key]['defaultValue'] = {'value': str(defaultValue)}
-            merged_parameters[key]['valueType'] = valueType
-            if description:
-                merged_parameters[key]['description'] = description
-            updated_count += 1
-        else:
-            merged_parameters[key] = {
-                'defaultValue': {'value': str(defaultValue)},
-                'valueType': valueType,
-            }
-            if description:
-                merged_parameters[key]['description'] = description
-            added_count += 1
-    
-    print(f'✅ {added_count} yeni parametre eklendi')
-    print(f'✅ {updated_count} parametre güncellendi')
-    print(f'📊 Toplam parametre sayısı: {len(merged_parameters)}')
+    # Client ve server template'lerini eşzamanlı yayınla
+    print('📤 Client ve server Remote Config template\'leri yükleniyor...')
+    results = publish_all(project_id, access_token, config_path, metrics)
     print()
     
-    # Template'i güncelle
-    updated_template = {
-        **current_template,
-        'parameters': merged_parameters,
-        'version': {
-            **current_template.get('version', {}),
-            'description': 'Amazon Rewards ve Points sistemi için Remote Config ayarları',
-        },
-    }
-    
-    # Template'i yükle
-    print('📤 Remote Config yükleniyor...')
-    result = deploy_template(project_id, access_token, updated_template, etag)
-    
-    if result:
-        print('\n✅ Remote Config başarıyla yüklendi!')
-        print(f'   Version: {result.get("version", {}).get("versionNumber", "N/A")}')
-        print(f'   Update Time: {result.get("version", {}).get("updateTime", "N/A")}')
+    if all(results.values()):
+        metrics.outcome = 'success'
+        print('✅ Remote Config başarıyla yüklendi!')
+        for namespace, result in results.items():
+            print(f'   {namespace}: Version {result.get("version", {}).get("versionNumber", "N/A")}, '
+                  f'Update Time {result.get("version", {}).get("updateTime", "N/A")}')
         print()
         print('=' * 60)
         print('🎉 Tamamlandı!')
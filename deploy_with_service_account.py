@@ -8,7 +8,8 @@ import json
 import sys
 import os
 from pathlib import Path
-import requests
+from remote_config_metrics import start_run
+from remote_config_publish import publish_all
 
 def load_service_account_key():
     """Service account key dosyasını yükle"""
@@ -69,102 +70,14 @@ def get_access_token(service_account):
         traceback.print_exc()
         return None
 
-def deploy_remote_config(project_id, access_token, config_path):
-    """Remote Config'i yükle"""
-    # Mevcut template'i al
-    url = f'https://firebaseremoteconfig.googleapis.com/v1/projects/{project_id}/remoteConfig'
-    headers = {
-        'Authorization': f'Bearer {access_token}',
-        'Content-Type': 'application/json',
-    }
-    
-    print('📥 Mevcut Remote Config template alınıyor...')
-    response = requests.get(url, headers=headers)
-    
-    if response.status_code != 200:
-        print(f'❌ Template alınamadı: HTTP {response.status_code}')
-        print(f'   Response: {response.text}')
-        return False
-    
-    current_template = response.json()
-    etag = response.headers.get('ETag')
-    
-    print('✅ Mevcut template alındı')
-    print(f'   Mevcut parametre sayısı: {len(current_template.get("parameters", {}))}')
-    print(f'   ETag: {etag}')
-    print()
-    
-    # Yeni config'i oku
-    with open(config_path, 'r') as f:
-        new_config = json.load(f)
-    
-    # Parametreleri birleştir
-    print('🔀 Parametreler birleştiriliyor...')
-    merged_parameters = current_template.get('parameters', {}).copy()
-    new_parameters = new_config.get('parameters', {})
-    
-    added_count = 0
-    updated_count = 0
-    
-    for key, param_config in new_parameters.items():
-        defaultValue = param_config.get('defaultValue', {}).get('value')
-        valueType = param_config.get('valueType', 'STRING')
-        description = param_config.get('description', '')
-        
-        if not defaultValue and defaultValue != '0' and defaultValue != '':
-            continue
-        
-        if key in merged_parameters:
-            merged_parameters[key]['defaultValue'] = {'value': str(defaultValue)}
-            merged_parameters[key]['valueType'] = valueType
-            if description:
-                merged_parameters[key]['description'] = description
-            updated_count += 1
-        else:
-            merged_parameters[key] = {
-                'defaultValue': {'value': str(defaultValue)},
-                'valueType': valueType,
-            }
-            if description:
-                merged_parameters[key]['description'] = description
-            added_count += 1
-    
-    print(f'✅ {added_count} yeni parametre eklendi')
-    print(f'✅ {updated_count} parametre güncellendi')
-    print(f'📊 Toplam parametre sayısı: {len(merged_parameters)}')
-    print()
-    
-    # Template'i güncelle
-    updated_template = {
-        **current_template,
-        'parameters': merged_parameters,
-        'version': {
-            **current_template.get('version', {}),
-            'description': 'Amazon Rewards ve Points sistemi için Remote Config ayarları',
-        },
-    }
-    
-    # Template'i yükle
-    print('📤 Remote Config yükleniyor...')
-    headers['If-Match'] = etag
-    response = requests.put(url, headers=headers, json=updated_template)
-    
-    if response.status_code == 200:
-        result = response.json()
-        print('\n✅ Remote Config başarıyla yüklendi!')
-        print(f'   Version: {result.get("version", {}).get("versionNumber", "N/A")}')
-        print(f'   Update Time: {result.get("version", {}).get("updateTime", "N/A")}')
-        return True
-    else:
-        print(f'❌ Template yüklenemedi: HTTP {response.status_code}')
-        print(f'   Response: {response.text}')
-        return False
-
 def main():
     print('🚀 Firebase Remote Config Deployment (Service Account)')
     print('=' * 60)
     print()
     
+    # Metrikler çıkışta .remote_config_metrics.db'ye yazılır
+    metrics = start_run('deploy_with_service_account')
+    
     # Service account key yükle
     print('🔑 Service account key yükleniyor...')
     service_account = load_service_account_key()
@@ -173,13 +86,15 @@ def main():
         sys.exit(1)
     
     project_id = service_account.get('project_id', 'qanta-de0b9')
+    metrics.project = project_id
     print(f'✅ Service account key yüklendi')
     print(f'📋 Project ID: {project_id}')
     print()
     
     # Access token al
     print('🔐 Access token alınıyor...')
-    access_token = get_access_token(service_account)
+    with metrics.phase('auth'):
+        access_token = get_access_token(service_account)
     
     if not access_token:
         print('\n💡 Google Auth kütüphanesini yükleyin:')
@@ -195,10 +110,12 @@ def main():
         print(f'❌ Config dosyası bulunamadı: {config_path}')
         sys.exit(1)
     
-    # Remote Config'i yükle
-    success = deploy_remote_config(project_id, access_token, config_path)
+    # Client ve server template'lerini eşzamanlı yükle
+    results = publish_all(project_id, access_token, config_path, metrics)
+    success = all(results.values())
     
     if success:
+        metrics.outcome = 'success'
         print()
         print('=' * 60)
         print('🎉 Tamamlandı!')
@@ -0,0 +1,371 @@
+#!/usr/bin/env python3
+"""
+Remote Config Parametre Kataloğu
+.firebaserc'deki tüm projelerin (dev, staging, prod...) template'lerini yerel,
+indeksli bir SQLite veritabanına alır. "X key'i hangi projelerde farklı",
+"prod'da bu hafta değişen key'ler" ve ortamlar arası drift matrisi gibi
+sorgular ağa çıkmadan çalışır. Yenileme ETag ile artımlıdır: template
+değişmemişse hiçbir satır yazılmaz, değişmişse yalnızca farklı değerler
+güncellenir ve geçmişe eklenir.
+"""
+
+import argparse
+import os
+import sqlite3
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+
+from remote_config_http import http_session
+from remote_config_loader import ResponseReader, iter_template, load_template
+from remote_config_model import Template
+from remote_config_publish import template_url
+from remote_config_validation import iter_values
+
+DB_PATH = Path(os.environ.get(
+    'REMOTE_CONFIG_CATALOG_DB',
+    Path(__file__).parent / '.remote_config_catalog.db',
+))
+FIREBASERC_PATH = Path(__file__).parent / '.firebaserc'
+
+# Varsayılan değer satırları boş koşul adıyla saklanır (PRIMARY KEY'de NULL olmasın)
+DEFAULT_CONDITION = ''
+
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS environments (
+    env TEXT PRIMARY KEY,
+    source TEXT NOT NULL,
+    etag TEXT,
+    version TEXT,
+    refreshed_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS parameter_values (
+    env TEXT NOT NULL REFERENCES environments(env),
+    key TEXT NOT NULL,
+    condition TEXT NOT NULL,
+    value_type TEXT,
+    value TEXT NOT NULL,
+    PRIMARY KEY (env, key, condition)
+);
+CREATE TABLE IF NOT EXISTS changes (
+    env TEXT NOT NULL,
+    key TEXT NOT NULL,
+    condition TEXT NOT NULL,
+    old_value TEXT,
+    new_value TEXT,
+    changed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS parameter_values_key ON parameter_values(key, condition);
+CREATE INDEX IF NOT EXISTS changes_env_changed ON changes(env, changed_at);
+CREATE INDEX IF NOT EXISTS changes_key ON changes(key);
+'''
+
+
+def connect(path=DB_PATH):
+    """Veritabanını aç, tablolar yoksa oluştur"""
+    connection = sqlite3.connect(path)
+    connection.executescript(SCHEMA)
+    return connection
+
+
+def load_environments(path=FIREBASERC_PATH):
+    """.firebaserc alias → project ID (aynı projeye bakan alias'lar tekilleştirilir)"""
+    if not Path(path).exists():
+        return {'default': 'qanta-de0b9'}
+    environments = {}
+    for alias, project_id in load_template(path).get('projects', {}).items():
+        if project_id not in environments.values():
+            environments[alias] = project_id
+    return environments
+
+
+def _timestamp(value):
+    """RFC 3339 (ör: 2024-05-01T10:20:30.123456789Z) → epoch saniye"""
+    if not value:
+        return None
+    date, _, fraction = value.rstrip('Z').partition('.')
+    return datetime.fromisoformat(f'{date}.{(fraction or "0")[:6]}+00:00').timestamp()
+
+
+def fetch_template(project_id, access_token, etag=None):
+    """Template'i al; ETag değişmemişse (304) template None döner"""
+    headers = {
+        'Authorization': f'Bearer {access_token}',
+        'Content-Type': 'application/json',
+    }
+    if etag:
+        headers['If-None-Match'] = etag
+
+    response = http_session().get(template_url(project_id), headers=headers, stream=True)
+    if response.status_code == 304:
+        response.close()
+        return None, etag
+    if response.status_code == 200:
+        with response:
+            template = Template.from_items(iter_template(ResponseReader(response)))
+        return template, response.headers.get('ETag')
+    raise RuntimeError(f'{project_id}: HTTP {response.status_code} {response.text}')
+
+
+def ingest(connection, env, source, template, etag=None, changed_at=None):
+    """Template'i katalogdaki mevcut hâliyle karşılaştırıp yalnızca farkları yaz
+
+    (eklenen, silinen, değişen) satır sayılarını döndürür. Ortamın ilk alımı
+    geçmişe yazılmaz; aksi halde tüm key'ler o an değişmiş görünürdü.
+    changed_at verilmezse değişiklikler alım anıyla kaydedilir.
+    """
+    version = template.version or {}
+    changed_at = changed_at or time.time()
+
+    new_rows = {
+        (key, condition or DEFAULT_CONDITION): (value_type, value)
+        for key, condition, value_type, value in iter_values(template)
+    }
+    old_rows = {
+        (key, condition): (value_type, value)
+        for key, condition, value_type, value in connection.execute(
+            'SELECT key, condition, value_type, value FROM parameter_values WHERE env = ?', (env,)
+        )
+    }
+
+    known = connection.execute('SELECT 1 FROM environments WHERE env = ?', (env,)).fetchone() is not None
+
+    added = list(new_rows.keys() - old_rows.keys())
+    removed = list(old_rows.keys() - new_rows.keys())
+    updated = [row for row in new_rows.keys() & old_rows.keys() if new_rows[row] != old_rows[row]]
+
+    with connection:
+        connection.execute(
+            '''
+            INSERT INTO environments (env, source, etag, version, refreshed_at) VALUES (?, ?, ?, ?, ?)
+            ON CONFLICT(env) DO UPDATE SET
+                source = excluded.source, etag = excluded.etag,
+                version = excluded.version, refreshed_at = excluded.refreshed_at
+            ''',
+            (env, source, etag, version.get('versionNumber'), time.time()),
+        )
+        connection.executemany(
+            'DELETE FROM parameter_values WHERE env = ? AND key = ? AND condition = ?',
+            [(env, key, condition) for key, condition in removed],
+        )
+        connection.executemany(
+            '''
+            INSERT INTO parameter_values (env, key, condition, value_type, value) VALUES (?, ?, ?, ?, ?)
+            ON CONFLICT(env, key, condition) DO UPDATE SET
+                value_type = excluded.value_type, value = excluded.value
+            ''',
+            [(env, key, condition, *new_rows[key, condition]) for key, condition in added + updated],
+        )
+        if known:
+            connection.executemany(
+                'INSERT INTO changes (env, key, condition, old_value, new_value, changed_at) VALUES (?, ?, ?, ?, ?, ?)',
+                [
+                    (env, key, condition,
+                     old_rows[key, condition][1] if (key, condition) in old_rows else None,
+                     new_rows[key, condition][1] if (key, condition) in new_rows else None,
+                     changed_at)
+                    for key, condition in added + removed + updated
+                ],
+            )
+    return len(added), len(removed), len(updated)
+
+
+def stored_etags(connection):
+    return dict(connection.execute('SELECT env, etag FROM environments'))
+
+
+def refresh(connection, access_token, environments):
+    """Projeleri eşzamanlı al, değişenleri kataloğa yaz
+
+    env → (eklenen, silinen, değişen), değişiklik yoksa None, alınamadıysa
+    hatanın kendisi. Bir projenin hatası diğerlerinin yenilenmesini durdurmaz.
+    """
+    etags = stored_etags(connection)
+    with ThreadPoolExecutor(max_workers=len(environments) or 1) as pool:
+        futures = {
+            env: pool.submit(fetch_template, project_id, access_token, etags.get(env))
+            for env, project_id in environments.items()
+        }
+        # SQLite bağlantısı tek thread'den kullanılır; yazma ana thread'de yapılır
+        results = {}
+        for env, future in futures.items():
+            try:
+                template, etag = future.result()
+            except Exception as e:
+                results[env] = e
+                continue
+            if template is None or (etag and etag == etags.get(env)):
+                results[env] = None
+            else:
+                # API'den gelen template'in yayınlanma zamanı bilinir
+                changed_at = _timestamp((template.version or {}).get('updateTime'))
+                results[env] = ingest(connection, env, environments[env], template, etag, changed_at)
+        return results
+
+
+def ingest_file(connection, env, path):
+    """Yerel bir template dosyasını (ör: current_config.json) ortam olarak ekle
+
+    Dosyadaki version.updateTime indirildiği sürüme aittir, dosyanın
+    değiştiği ana değil; değişiklikler alım anıyla kaydedilir.
+    """
+    return ingest(connection, env, str(path), Template.from_json(load_template(path)))
+
+
+def key_values(connection, key):
+    """Key'in tüm ortamlardaki değerleri: condition → {env: value}"""
+    values = {}
+    for env, condition, value in connection.execute(
+        'SELECT env, condition, value FROM parameter_values WHERE key = ? ORDER BY condition, env', (key,)
+    ):
+        values.setdefault(condition, {})[env] = value
+    return values
+
+
+def changes_since(connection, env, since):
+    """Ortamda since'ten sonra değişen (key, condition, eski, yeni, zaman) kayıtları"""
+    return connection.execute(
+        '''
+        SELECT key, condition, old_value, new_value, changed_at FROM changes
+        WHERE env = ? AND changed_at >= ? ORDER BY changed_at, key, condition
+        ''',
+        (env, since),
+    ).fetchall()
+
+
+def drift_matrix(connection, conditions=False):
+    """Ortamlar arasında farklı olan (ya da bazılarında eksik olan) değerler
+
+    (key, condition) → {env: value}; yalnızca varsayılan değerler karşılaştırılır,
+    conditions=True ise koşullu değerler de dahil edilir.
+    """
+    envs = [env for env, in connection.execute('SELECT env FROM environments ORDER BY env')]
+    rows = connection.execute(
+        '''
+        SELECT v.key, v.condition, v.env, v.value FROM parameter_values v
+        JOIN (
+            SELECT key, condition FROM parameter_values
+            WHERE (? OR condition = '')
+            GROUP BY key, condition
+            HAVING COUNT(DISTINCT value) > 1 OR COUNT(*) < ?
+        ) d ON d.key = v.key AND d.condition = v.condition
+        ORDER BY v.key, v.condition, v.env
+        ''',
+        (conditions, len(envs)),
+    )
+    matrix = {}
+    for key, condition, env, value in rows:
+        matrix.setdefault((key, condition), {})[env] = value
+    return envs, matrix
+
+
+def _format_value(value, width=24):
+    if value is None:
+        return '—'
+    value = value.replace('\n', ' ')
+    return value if len(value) <= width else value[:width - 1] + '…'
+
+
+def _parse_file(text):
+    env, separator, path = text.partition('=')
+    if not separator:
+        raise argparse.ArgumentTypeError('ENV=PATH biçiminde olmalı')
+    return env, path
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Remote Config parametre kataloğu')
+    parser.add_argument('--db', default=DB_PATH, help='Katalog veritabanı')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    refresh_parser = commands.add_parser('refresh', help='Projeleri (ve dosyaları) kataloğa al')
+    refresh_parser.add_argument('--env', action='append', help='Yalnızca bu .firebaserc alias\'ı (tekrarlanabilir)')
+    refresh_parser.add_argument('--file', action='append', type=_parse_file, default=[],
+                                help='Yerel template, ör: local=current_config.json (tekrarlanabilir)')
+    refresh_parser.add_argument('--offline', action='store_true', help='Yalnızca --file kaynaklarını al')
+
+    key_parser = commands.add_parser('key', help='Key\'in ortamlara göre değerleri')
+    key_parser.add_argument('key')
+
+    changes_parser = commands.add_parser('changes', help='Ortamda son N günde değişen key\'ler')
+    changes_parser.add_argument('env')
+    changes_parser.add_argument('--days', type=float, default=7)
+
+    drift_parser = commands.add_parser('drift', help='Ortamlar arası drift matrisi')
+    drift_parser.add_argument('--conditions', action='store_true', help='Koşullu değerleri de karşılaştır')
+
+    args = parser.parse_args()
+    connection = connect(args.db)
+
+    if args.command == 'refresh':
+        for env, path in args.file:
+            added, removed, updated = ingest_file(connection, env, path)
+            print(f'📄 {env}: {added} eklendi, {removed} silindi, {updated} değişti')
+        if args.offline:
+            return
+
+        environments = load_environments()
+        if args.env:
+            environments = {env: environments[env] for env in args.env}
+
+        from deploy_remote_config_final import get_firebase_access_token
+        access_token = get_firebase_access_token()
+        if not access_token:
+            sys.exit(1)
+
+        failed = False
+        for env, result in refresh(connection, access_token, environments).items():
+            if isinstance(result, Exception):
+                failed = True
+                print(f'❌ {env}: {result}')
+            elif result is None:
+                print(f'✅ {env}: değişiklik yok (ETag aynı)')
+            else:
+                print(f'🔄 {env}: {result[0]} eklendi, {result[1]} silindi, {result[2]} değişti')
+        if failed:
+            sys.exit(1)
+
+    elif args.command == 'key':
+        values = key_values(connection, args.key)
+        if not values:
+            print(f'ℹ️  {args.key} katalogda yok')
+            return
+        envs = [env for env, in connection.execute('SELECT env FROM environments ORDER BY env')]
+        for condition, by_env in values.items():
+            label = condition or 'default'
+            status = '✅ aynı' if len(set(by_env.values())) == 1 and len(by_env) == len(envs) else '⚠️  farklı'
+            print(f'{args.key} [{label}] {status}')
+            for env in envs:
+                print(f'   {env:<12} {_format_value(by_env.get(env), 60)}')
+
+    elif args.command == 'changes':
+        since = time.time() - args.days * 86400
+        rows = changes_since(connection, args.env, since)
+        if not rows:
+            print(f'ℹ️  {args.env}: son {args.days:g} günde değişiklik yok')
+            return
+        for key, condition, old_value, new_value, changed_at in rows:
+            when = datetime.fromtimestamp(changed_at).strftime('%Y-%m-%d %H:%M')
+            label = f'{key} [{condition}]' if condition else key
+            print(f'{when}  {label}: {_format_value(old_value)} → {_format_value(new_value)}')
+
+    else:
+        envs, matrix = drift_matrix(connection, args.conditions)
+        if not matrix:
+            print(f'✅ {len(envs)} ortam arasında drift yok')
+            return
+        print(f'{"Key":<40} ' + ' '.join(f'{env:<24}' for env in envs))
+        print('-' * (41 + 25 * len(envs)))
+        for (key, condition), by_env in matrix.items():
+            label = f'{key} [{condition}]' if condition else key
+            print(f'{_format_value(label, 40):<40} ' + ' '.join(
+                f'{_format_value(by_env.get(env)):<24}' for env in envs
+            ))
+        print()
+        print(f'⚠️  {len(matrix)} değer ortamlar arasında farklı')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,300 @@
+#!/usr/bin/env python3
+"""
+Remote Config HTTP Katmanı (Kayıt / Tekrar Oynatma)
+Deploy script'leri isteklerini bu modülün session'ı üzerinden yapar.
+REMOTE_CONFIG_HTTP_MODE=record gerçek istekleri gizli bilgiler maskelenmiş
+olarak kaydeder, =replay ağa çıkmadan kayıttan oynatır. bench komutu
+get_current_template → merge → deploy_template akışını (client) kayıttan tekrar
+tekrar çalıştırıp süre/CPU ölçer.
+"""
+
+import argparse
+import base64
+import contextlib
+import io
+import json
+import os
+import re
+import sys
+import threading
+import time
+from pathlib import Path
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+import requests
+from requests.adapters import BaseAdapter, HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+DEFAULT_CASSETTE = Path(__file__).parent / 'remote_config_cassette.jsonl'
+
+REDACTED = '<redacted>'
+REDACT_HEADERS = frozenset(('authorization', 'cookie', 'set-cookie', 'x-goog-api-key'))
+REDACT_FIELDS = frozenset((
+    'access_token', 'refresh_token', 'id_token', 'assertion', 'private_key',
+    'private_key_id', 'client_secret',
+))
+
+
+def _redact_headers(headers):
+    return {
+        key: (REDACTED if key.lower() in REDACT_HEADERS else value)
+        for key, value in headers.items()
+    }
+
+
+def _redact_json(obj):
+    if isinstance(obj, dict):
+        return {
+            key: (REDACTED if key in REDACT_FIELDS else _redact_json(value))
+            for key, value in obj.items()
+        }
+    if isinstance(obj, list):
+        return [_redact_json(value) for value in obj]
+    return obj
+
+
+def _redact_body(body, content_type):
+    """JSON ve form gövdelerindeki token/anahtar alanlarını maskele"""
+    if not body:
+        return body
+    if 'application/x-www-form-urlencoded' in (content_type or ''):
+        fields = parse_qsl(body.decode('utf-8'), keep_blank_values=True)
+        return urlencode([
+            (key, REDACTED if key in REDACT_FIELDS else value) for key, value in fields
+        ]).encode('utf-8')
+    try:
+        data = json.loads(body)
+    except ValueError:
+        return body
+    return json.dumps(_redact_json(data), ensure_ascii=False).encode('utf-8')
+
+
+def _encode_body(body):
+    if body is None:
+        return {}
+    if isinstance(body, str):
+        body = body.encode('utf-8')
+    try:
+        return {'body': body.decode('utf-8')}
+    except UnicodeDecodeError:
+        return {'body_base64': base64.b64encode(body).decode('ascii')}
+
+
+def _decode_body(entry):
+    if 'body_base64' in entry:
+        return base64.b64decode(entry['body_base64'])
+    return entry.get('body', '').encode('utf-8')
+
+
+def _request_key(method, url):
+    parts = urlsplit(url)
+    return f'{method.upper()} {parts.path}' + (f'?{parts.query}' if parts.query else '')
+
+
+class RecordingAdapter(HTTPAdapter):
+    """Gerçek istekleri yapar ve maskelenmiş kopyalarını cassette'e ekler"""
+
+    def __init__(self, cassette_path, **kwargs):
+        super().__init__(**kwargs)
+        self.cassette_path = Path(cassette_path)
+        self._lock = threading.Lock()
+
+    def send(self, request, **kwargs):
+        start = time.perf_counter()
+        response = super().send(request, **kwargs)
+        body = response.content
+        elapsed = time.perf_counter() - start
+
+        body_out = request.body.encode('utf-8') if isinstance(request.body, str) else request.body
+        entry = {
+            'request': {
+                'method': request.method,
+                'url': request.url,
+                'headers': _redact_headers(request.headers),
+                **_encode_body(_redact_body(body_out, request.headers.get('Content-Type'))),
+            },
+            'response': {
+                'status': response.status_code,
+                'reason': response.reason,
+                'headers': _redact_headers(response.headers),
+                **_encode_body(_redact_body(body, response.headers.get('Content-Type'))),
+            },
+            'elapsed': elapsed,
+        }
+        with self._lock, open(self.cassette_path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(entry, ensure_ascii=False) + '\n')
+        return response
+
+
+class ReplayAdapter(BaseAdapter):
+    """Cassette'teki yanıtları sırayla döndürür; ağa hiç çıkmaz
+
+    speed: 1 → kaydedilen gecikme aynen, 0.5 → yarısı, 0 → beklemeden.
+    """
+
+    def __init__(self, cassette_path, speed=1.0):
+        super().__init__()
+        self.speed = speed
+        self._queues = {}
+        self._lock = threading.Lock()
+        with open(cassette_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                if line.strip():
+                    entry = json.loads(line)
+                    key = _request_key(entry['request']['method'], entry['request']['url'])
+                    self._queues.setdefault(key, []).append(entry)
+        for queue in self._queues.values():
+            queue.reverse()
+
+    def send(self, request, **kwargs):
+        key = _request_key(request.method, request.url)
+        with self._lock:
+            queue = self._queues.get(key)
+            if not queue:
+                raise requests.ConnectionError(f'Cassette\'te eşleşen kayıt yok: {key}', request=request)
+            entry = queue.pop()
+
+        if self.speed:
+            time.sleep(entry.get('elapsed', 0) * self.speed)
+
+        recorded = entry['response']
+        response = requests.Response()
+        response.status_code = recorded['status']
+        response.reason = recorded.get('reason')
+        response.headers = CaseInsensitiveDict(recorded.get('headers', {}))
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.raw = io.BytesIO(_decode_body(recorded))
+        response.url = request.url
+        response.request = request
+        response.connection = self
+        return response
+
+    def close(self):
+        pass
+
+
+def create_session(mode=None, cassette=DEFAULT_CASSETTE, speed=1.0):
+    """Mod'a göre (None, 'record', 'replay') yapılandırılmış requests.Session"""
+    session = requests.Session()
+    if mode == 'record':
+        adapter = RecordingAdapter(cassette)
+    elif mode == 'replay':
+        adapter = ReplayAdapter(cassette, speed)
+    elif mode:
+        raise ValueError(f'Bilinmeyen HTTP modu: {mode}')
+    else:
+        return session
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+_session = None
+
+
+def http_session():
+    """Script'lerin paylaştığı session; ortam değişkenleriyle yapılandırılır"""
+    global _session
+    if _session is None:
+        _session = create_session(
+            os.environ.get('REMOTE_CONFIG_HTTP_MODE') or None,
+            os.environ.get('REMOTE_CONFIG_CASSETTE', DEFAULT_CASSETTE),
+            float(os.environ.get('REMOTE_CONFIG_REPLAY_SPEED', '1')),
+        )
+    return _session
+
+
+def use_session(session):
+    """Paylaşılan session'ı değiştir (bench ve testler için)"""
+    global _session
+    _session = session
+
+
+PROJECT_RE = re.compile(r'/projects/([^/]+)/')
+
+
+def cassette_project(cassette):
+    """Cassette'teki ilk Remote Config isteğinin project ID'si"""
+    with open(cassette, 'r', encoding='utf-8') as f:
+        for line in f:
+            if line.strip():
+                match = PROJECT_RE.search(urlsplit(json.loads(line)['request']['url']).path)
+                if match:
+                    return match.group(1)
+    raise ValueError(f'Cassette\'te project ID içeren istek yok: {cassette}')
+
+
+def bench(cassette, config_path, runs, speed, project_id=None):
+    """Deploy akışını kayıttan runs kez çalıştır, süre ve CPU ölçümlerini döndür
+
+    project_id verilmezse kaydın yapıldığı proje cassette'ten okunur; istekler
+    URL yoluyla eşleştiği için kayıttaki projeyle aynı olmalıdır.
+    """
+    # python3 remote_config_http.py ile çalışırken bu dosya __main__ olur;
+    # yayınlama modülünün kullandığı modül örneğinin session'ı değiştirilmeli
+    import remote_config_http as transport
+    import remote_config_publish as deploy
+    from remote_config_loader import iter_parameters
+    from remote_config_model import merge_parameters
+
+    if project_id is None:
+        project_id = cassette_project(cassette)
+    wall_times = []
+    cpu_start = time.process_time()
+    wall_start = time.perf_counter()
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        for _ in range(runs):
+            transport.use_session(transport.create_session('replay', cassette, speed))
+            start = time.perf_counter()
+            current_template, etag = deploy.get_current_template(project_id, REDACTED)
+            if current_template is None:
+                raise RuntimeError('Kayıttaki template alınamadı')
+            template, _, _ = merge_parameters(current_template, iter_parameters(config_path))
+            if deploy.deploy_template(project_id, REDACTED, template, etag) is None:
+                raise RuntimeError('Kayıttaki deploy başarısız')
+            wall_times.append(time.perf_counter() - start)
+
+    wall_total = time.perf_counter() - wall_start
+    wall_times.sort()
+    return {
+        'runs': runs,
+        'speed': speed,
+        'wall_seconds': wall_total,
+        'cpu_seconds': time.process_time() - cpu_start,
+        'runs_per_second': runs / wall_total if wall_total else None,
+        'p50_ms': wall_times[len(wall_times) // 2] * 1000,
+        'max_ms': wall_times[-1] * 1000,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Remote Config HTTP kayıt/oynatma')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    bench_parser = commands.add_parser('bench', help='Deploy akışını kayıttan çalıştır ve ölç')
+    bench_parser.add_argument('--cassette', default=DEFAULT_CASSETTE)
+    bench_parser.add_argument('--config', default=Path(__file__).parent / 'remote_config_merged.json')
+    bench_parser.add_argument('--project', help='Kayıttaki project ID (varsayılan: cassette\'ten okunur)')
+    bench_parser.add_argument('--runs', type=int, default=100)
+    bench_parser.add_argument('--speed', type=float, default=0.0, help='Gecikme çarpanı (0: beklemeden)')
+    bench_parser.add_argument('--json', action='store_true', help='Sonucu CI için JSON olarak yaz')
+
+    args = parser.parse_args()
+
+    result = bench(args.cassette, args.config, args.runs, args.speed, args.project)
+    if args.json:
+        json.dump(result, sys.stdout)
+        print()
+        return
+
+    print(f'🏁 {result["runs"]} çalıştırma (gecikme çarpanı {result["speed"]})')
+    print(f'   Toplam süre: {result["wall_seconds"]:.3f} sn')
+    print(f'   CPU süresi: {result["cpu_seconds"]:.3f} sn')
+    print(f'   Hız: {result["runs_per_second"]:.1f} çalıştırma/sn')
+    print(f'   p50: {result["p50_ms"]:.2f} ms, max: {result["max_ms"]:.2f} ms')
+
+
+if __name__ == '__main__':
+    main()
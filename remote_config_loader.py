@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+Remote Config Template Loader
+Template'leri dosyadan veya HTTP yanıtından okur. ijson yüklüyse hem config
+dosyalarının hem de API'den alınan template'lerin parametreleri akış
+(streaming) ile tek tek okunur; orjson yüklüyse hızlı JSON backend kullanılır.
+"""
+
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+CHUNK_SIZE = 64 * 1024
+
+
+class ResponseReader:
+    """iter_content() parçalarını ijson'un beklediği read() arayüzüne çevirir
+
+    stream=True ile alınmış yanıtlarda gövde bellekte bir kez bile tamamen
+    tutulmaz; okunan byte sayısı bytes_read'de tutulur.
+    """
+
+    def __init__(self, response):
+        self._chunks = response.iter_content(CHUNK_SIZE)
+        self._buffer = b''
+        self.bytes_read = 0
+
+    def read(self, size=-1):
+        while size < 0 or len(self._buffer) < size:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                break
+            self.bytes_read += len(chunk)
+            self._buffer += chunk
+        if size < 0:
+            data, self._buffer = self._buffer, b''
+        else:
+            data, self._buffer = self._buffer[:size], self._buffer[size:]
+        return data
+
+
+def _is_response(source):
+    return hasattr(source, 'iter_content')
+
+
+def json_loads(data):
+    """JSON'u mevcut en hızlı backend ile çöz"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(obj, pretty=False, default=None):
+    """JSON'u UTF-8 bytes olarak üret (ensure_ascii=False ile aynı çıktı)"""
+    if orjson is not None:
+        return orjson.dumps(obj, default=default, option=orjson.OPT_INDENT_2 if pretty else 0)
+    return json.dumps(
+        obj,
+        indent=2 if pretty else None,
+        separators=None if pretty else (',', ':'),
+        ensure_ascii=False,
+        default=default,
+    ).encode('utf-8')
+
+
+def load_template(source):
+    """Template'in tamamını tek kopya olarak yükle"""
+    if _is_response(source):
+        return json_loads(source.content)
+    if isinstance(source, ResponseReader):
+        return json_loads(source.read())
+    with open(source, 'rb') as f:
+        return json_loads(f.read())
+
+
+def dump_template(template, path, default=None):
+    """Template'i okunabilir formatta dosyaya yaz"""
+    with open(path, 'wb') as f:
+        f.write(json_dumps(template, pretty=True, default=default))
+
+
+def iter_parameters(path):
+    """Dosyadaki parametreleri (key, parametre) olarak tek tek üret
+
+    ijson yoksa dosya bir kez yüklenip parametreler yine sırayla döndürülür.
+    """
+    if ijson is None:
+        yield from load_template(path).get('parameters', {}).items()
+        return
+
+    with open(path, 'rb') as f:
+        yield from ijson.kvitems(f, 'parameters', use_float=True)
+
+
+def _build(events, event, value):
+    """İlk olayı verilen JSON değerini olay akışından kur"""
+    builder = ijson.ObjectBuilder()
+    builder.event(event, value)
+    if event not in ('start_map', 'start_array'):
+        return builder.value
+    depth = 1
+    for _, event, value in events:
+        builder.event(event, value)
+        if event in ('start_map', 'start_array'):
+            depth += 1
+        elif event in ('end_map', 'end_array'):
+            depth -= 1
+            if depth == 0:
+                break
+    return builder.value
+
+
+def iter_template(source):
+    """Template'i tek geçişte (bölüm, parametre adı, değer) olarak üret
+
+    parameters bölümü önce ('parameters', None, None) ile bildirilir (boş olsa
+    da), ardından parametreler ('parameters', key, parametre) olarak tek tek
+    gelir. Diğer bölümler (conditions, version...) (bölüm, None, değer)
+    olarak döndürülür. source bir dosya yolu veya ResponseReader olabilir;
+    ijson yoksa template bir kez yüklenir.
+    """
+    if ijson is None:
+        for section, value in load_template(source).items():
+            if section == 'parameters':
+                yield section, None, None
+                for key, param in value.items():
+                    yield section, key, param
+            else:
+                yield section, None, value
+        return
+
+    stream = source if isinstance(source, ResponseReader) else open(source, 'rb')
+    try:
+        events = ijson.parse(stream, use_float=True)
+        section = None
+        for prefix, event, value in events:
+            if prefix == '' and event == 'map_key':
+                section = value
+            elif prefix == section == 'parameters' and event == 'start_map':
+                yield section, None, None
+                for prefix, event, value in events:
+                    if prefix == 'parameters' and event == 'end_map':
+                        break
+                    _, first_event, first_value = next(events)
+                    yield section, value, _build(events, first_event, first_value)
+            elif prefix == section:
+                yield section, None, _build(events, event, value)
+    finally:
+        if stream is not source:
+            stream.close()
+
+
+def load_section(path, name, default=None):
+    """Dosyadan parametreler dışındaki tek bir bölümü (ör: version) oku"""
+    if ijson is None:
+        return load_template(path).get(name, default)
+    with open(path, 'rb') as f:
+        return next(ijson.items(f, name, use_float=True), default)
+
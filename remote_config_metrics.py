@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+"""
+Remote Config Deploy Metrikleri
+Her deploy çalışmasının faz sürelerini, payload boyutlarını, retry sayılarını
+ve sonucunu yerel bir SQLite veritabanında saklar. p50/p95/p99 sorgusu ve
+node exporter için Prometheus textfile çıktısı üretir.
+"""
+
+import argparse
+import atexit
+import os
+import sqlite3
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+DB_PATH = Path(os.environ.get(
+    'REMOTE_CONFIG_METRICS_DB',
+    Path(__file__).parent / '.remote_config_metrics.db',
+))
+
+PERCENTILES = (50, 95, 99)
+
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    script TEXT NOT NULL,
+    project TEXT,
+    started_at REAL NOT NULL,
+    duration_ms REAL NOT NULL,
+    outcome TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS phases (
+    run_id INTEGER NOT NULL REFERENCES runs(id),
+    phase TEXT NOT NULL,
+    duration_ms REAL NOT NULL,
+    payload_bytes INTEGER,
+    retries INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS runs_project_started ON runs(project, started_at);
+CREATE INDEX IF NOT EXISTS phases_run ON phases(run_id);
+'''
+
+
+def connect(path=DB_PATH):
+    """Veritabanını aç, tablolar yoksa oluştur"""
+    connection = sqlite3.connect(path)
+    connection.executescript(SCHEMA)
+    return connection
+
+
+class DeployMetrics:
+    """Tek bir deploy çalışmasının metrikleri; çıkışta veritabanına yazılır"""
+
+    def __init__(self, script, project=None, path=DB_PATH):
+        self.script = script
+        self.project = project
+        self.path = path
+        self.outcome = None
+        self.phases = {}
+        self._started_at = time.time()
+        self._start = time.perf_counter()
+        self._finished = False
+
+    def _phase(self, name):
+        return self.phases.setdefault(name, {'duration_ms': 0.0, 'payload_bytes': None, 'retries': 0})
+
+    @contextmanager
+    def phase(self, name):
+        """with bloğunun süresini faza ekle"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._phase(name)['duration_ms'] += (time.perf_counter() - start) * 1000
+
+    def payload(self, name, size):
+        """Faz için gönderilen/alınan byte sayısını kaydet"""
+        phase = self._phase(name)
+        phase['payload_bytes'] = (phase['payload_bytes'] or 0) + size
+
+    def retry(self, name):
+        """Faz için bir retry say"""
+        self._phase(name)['retries'] += 1
+
+    def finish(self, outcome=None):
+        """Çalışmayı kaydet (bir kez); sonuç verilmemişse 'error' yazılır"""
+        if self._finished:
+            return
+        self._finished = True
+        outcome = outcome or self.outcome or 'error'
+        duration_ms = (time.perf_counter() - self._start) * 1000
+        try:
+            with connect(self.path) as connection:
+                cursor = connection.execute(
+                    'INSERT INTO runs (script, project, started_at, duration_ms, outcome) VALUES (?, ?, ?, ?, ?)',
+                    (self.script, self.project, self._started_at, duration_ms, outcome),
+                )
+                connection.executemany(
+                    'INSERT INTO phases (run_id, phase, duration_ms, payload_bytes, retries) VALUES (?, ?, ?, ?, ?)',
+                    [
+                        (cursor.lastrowid, name, phase['duration_ms'], phase['payload_bytes'], phase['retries'])
+                        for name, phase in self.phases.items()
+                    ],
+                )
+            connection.close()
+        except sqlite3.Error as e:
+            print(f'⚠️  Deploy metrikleri kaydedilemedi: {e}')
+
+
+def start_run(script, project=None, path=DB_PATH):
+    """Metrik kaydını başlat; süreç sonlanırken (sys.exit dahil) otomatik kaydedilir"""
+    metrics = DeployMetrics(script, project, path)
+    atexit.register(metrics.finish)
+    return metrics
+
+
+def percentile(sorted_values, percent):
+    """Nearest-rank yüzdelik"""
+    if not sorted_values:
+        return None
+    rank = max(1, -(-percent * len(sorted_values) // 100))
+    return sorted_values[int(rank) - 1]
+
+
+def phase_summary(connection, project=None, since=None):
+    """(project, phase) başına süre yüzdelikleri, payload ve retry özetleri"""
+    query = '''
+        SELECT r.project, p.phase, p.duration_ms, p.payload_bytes, p.retries
+        FROM phases p JOIN runs r ON r.id = p.run_id
+        WHERE (? IS NULL OR r.project = ?) AND (? IS NULL OR r.started_at >= ?)
+        ORDER BY r.project, p.phase, p.duration_ms
+    '''
+    groups = {}
+    for row_project, phase, duration_ms, payload_bytes, retries in connection.execute(
+        query, (project, project, since, since)
+    ):
+        group = groups.setdefault((row_project or '', phase), {'durations': [], 'payloads': [], 'retries': 0})
+        group['durations'].append(duration_ms)
+        if payload_bytes is not None:
+            group['payloads'].append(payload_bytes)
+        group['retries'] += retries
+
+    summary = []
+    for (row_project, phase), group in groups.items():
+        durations = group['durations']
+        summary.append({
+            'project': row_project,
+            'phase': phase,
+            'count': len(durations),
+            'total_ms': sum(durations),
+            'percentiles': {p: percentile(durations, p) for p in PERCENTILES},
+            'payload_avg': sum(group['payloads']) / len(group['payloads']) if group['payloads'] else None,
+            'retries': group['retries'],
+        })
+    return summary
+
+
+def outcome_summary(connection, project=None, since=None):
+    """(project, outcome) başına çalışma sayıları"""
+    return connection.execute(
+        '''
+        SELECT COALESCE(project, ''), outcome, COUNT(*) FROM runs
+        WHERE (? IS NULL OR project = ?) AND (? IS NULL OR started_at >= ?)
+        GROUP BY project, outcome ORDER BY project, outcome
+        ''',
+        (project, project, since, since),
+    ).fetchall()
+
+
+def _label(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def export_prometheus(connection, output_path, since=None):
+    """node exporter textfile collector formatında yaz (atomik rename ile)
+
+    since yalnızca quantile'lara uygulanır; _sum/_count ve *_total sayaçları
+    tüm zamanlar üzerinden hesaplanır, yoksa pencere kaydıkça azalırlardı.
+    """
+    lines = [
+        '# HELP remote_config_deploy_phase_duration_seconds Deploy faz süresi',
+        '# TYPE remote_config_deploy_phase_duration_seconds summary',
+    ]
+    summary = phase_summary(connection)
+    recent = summary if since is None else phase_summary(connection, since=since)
+    percentiles = {(row['project'], row['phase']): row['percentiles'] for row in recent}
+    for row in summary:
+        labels = f'project="{_label(row["project"])}",phase="{_label(row["phase"])}"'
+        for p, value in percentiles.get((row['project'], row['phase']), {}).items():
+            lines.append(f'remote_config_deploy_phase_duration_seconds{{{labels},quantile="{p / 100}"}} {value / 1000}')
+        lines.append(f'remote_config_deploy_phase_duration_seconds_sum{{{labels}}} {row["total_ms"] / 1000}')
+        lines.append(f'remote_config_deploy_phase_duration_seconds_count{{{labels}}} {row["count"]}')
+    lines += [
+        '# HELP remote_config_deploy_phase_payload_bytes Ortalama payload boyutu',
+        '# TYPE remote_config_deploy_phase_payload_bytes gauge',
+    ]
+    for row in summary:
+        if row['payload_avg'] is not None:
+            lines.append(
+                f'remote_config_deploy_phase_payload_bytes{{project="{_label(row["project"])}",'
+                f'phase="{_label(row["phase"])}"}} {row["payload_avg"]}'
+            )
+    lines += [
+        '# HELP remote_config_deploy_phase_retries_total Faz retry sayısı (geçici HTTP hataları, ETag çakışmaları)',
+        '# TYPE remote_config_deploy_phase_retries_total counter',
+    ]
+    for row in summary:
+        lines.append(
+            f'remote_config_deploy_phase_retries_total{{project="{_label(row["project"])}",'
+            f'phase="{_label(row["phase"])}"}} {row["retries"]}'
+        )
+    lines += [
+        '# HELP remote_config_deploy_runs_total Sonuca göre deploy sayısı',
+        '# TYPE remote_config_deploy_runs_total counter',
+    ]
+    for row_project, outcome, count in outcome_summary(connection):
+        lines.append(
+            f'remote_config_deploy_runs_total{{project="{_label(row_project)}",outcome="{_label(outcome)}"}} {count}'
+        )
+
+    temp_path = f'{output_path}.tmp'
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        f.write('\n'.join(lines) + '\n')
+    os.replace(temp_path, output_path)
+
+
+def _format_ms(value):
+    return f'{value:.1f}' if value is not None else '-'
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Remote Config deploy metrikleri')
+    parser.add_argument('--db', default=DB_PATH, help='Metrik veritabanı')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    query = commands.add_parser('query', help='Faz bazında p50/p95/p99 göster')
+    query.add_argument('--project', help='Yalnızca bu proje')
+    query.add_argument('--days', type=float, help='Son N gün')
+
+    export = commands.add_parser('export', help='Prometheus textfile yaz')
+    export.add_argument('output', help='Çıktı dosyası (ör: /var/lib/node_exporter/remote_config.prom)')
+    export.add_argument('--days', type=float, help='Quantile\'lar için son N gün (sayaçlar tüm zamanlar)')
+
+    args = parser.parse_args()
+    since = time.time() - args.days * 86400 if args.days else None
+    connection = connect(args.db)
+
+    if args.command == 'export':
+        export_prometheus(connection, args.output, since=since)
+        print(f'✅ Prometheus metrikleri yazıldı: {args.output}')
+        return
+
+    summary = phase_summary(connection, project=args.project, since=since)
+    if not summary:
+        print('ℹ️  Kayıtlı deploy metriği yok')
+        return
+
+    print(f'{"Proje":<20} {"Faz":<12} {"n":>5} {"p50 ms":>10} {"p95 ms":>10} {"p99 ms":>10} {"retry":>6}')
+    print('-' * 79)
+    for row in summary:
+        p = row['percentiles']
+        print(
+            f'{row["project"]:<20} {row["phase"]:<12} {row["count"]:>5} '
+            f'{_format_ms(p[50]):>10} {_format_ms(p[95]):>10} {_format_ms(p[99]):>10} {row["retries"]:>6}'
+        )
+    print()
+    print('📊 Sonuçlar:')
+    for row_project, outcome, count in outcome_summary(connection, project=args.project, since=since):
+        print(f'   {row_project or "-"}: {outcome} × {count}')
+
+
+if __name__ == '__main__':
+    main()
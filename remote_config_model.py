@@ -0,0 +1,311 @@
+#!/usr/bin/env python3
+"""
+Remote Config Template Modeli
+Değiştirilemez, __slots__ kullanan parametre/koşul nesneleri. Birleştirme ve
+karşılaştırma değişmeyen parametreleri paylaşır; yalnızca değişenler için yeni
+nesne oluşturulur. REST JSON formatına kayıpsız dönüştürülür.
+"""
+
+from abc import ABC, abstractmethod
+from types import MappingProxyType
+
+EMPTY = MappingProxyType({})
+
+
+def _freeze(obj):
+    """JSON değerini değiştirilemez hale getir (dict → MappingProxyType, list → tuple)"""
+    if isinstance(obj, dict):
+        return MappingProxyType({key: _freeze(value) for key, value in obj.items()})
+    if isinstance(obj, list):
+        return tuple(_freeze(value) for value in obj)
+    return obj
+
+
+def _thaw(obj):
+    """_freeze'in tersi; REST JSON'a geri dönüştürür"""
+    if isinstance(obj, Frozen):
+        return obj.to_json()
+    if isinstance(obj, MappingProxyType):
+        return {key: _thaw(value) for key, value in obj.items()}
+    if isinstance(obj, tuple):
+        return [_thaw(value) for value in obj]
+    return obj
+
+
+def _same(a, b):
+    """Alan değişmiş mi? Skaler değerler eşitlikle, diğerleri kimlikle karşılaştırılır"""
+    if a is b:
+        return True
+    return type(a) is type(b) and isinstance(a, (str, int, float)) and a == b
+
+
+def _split(data, known):
+    """Bilinen alanları ayır, kalanları kayıpsızlık için extra olarak sakla"""
+    extra = {key: value for key, value in data.items() if key not in known}
+    return _freeze(extra) if extra else EMPTY
+
+
+class Frozen(ABC):
+    """Değiştirilemez, slot tabanlı model nesnelerinin ortak tabanı
+
+    Verilmeyen alanlar None olur; bilinmeyen JSON alanlarını tutan extra ise EMPTY.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, **fields):
+        for name in self.__slots__:
+            default = EMPTY if name == 'extra' else None
+            object.__setattr__(self, name, fields.get(name, default))
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f'{type(self).__name__} değiştirilemez')
+
+    def __delattr__(self, name):
+        raise AttributeError(f'{type(self).__name__} değiştirilemez')
+
+    def __eq__(self, other):
+        if self is other:
+            return True
+        if type(self) is not type(other):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+    __hash__ = None
+
+    def __repr__(self):
+        fields = ', '.join(f'{name}={getattr(self, name)!r}' for name in self.__slots__)
+        return f'{type(self).__name__}({fields})'
+
+    def replace(self, **changes):
+        """Verilen alanları değiştirilmiş yeni nesne; diğer alanlar paylaşılır"""
+        if all(_same(getattr(self, name), value) for name, value in changes.items()):
+            return self
+        return type(self)(**{name: changes.get(name, getattr(self, name)) for name in self.__slots__})
+
+    @abstractmethod
+    def json_fragment(self):
+        """Alt nesneleri dönüştürmeden tek seviyelik REST JSON sözlüğü"""
+
+    def to_json(self):
+        """Tam REST JSON karşılığı"""
+        return {key: _thaw(value) for key, value in self.json_fragment().items()}
+
+
+class Value(Frozen):
+    """defaultValue / conditionalValues girdisi"""
+
+    __slots__ = ('value', 'use_in_app_default', 'extra')
+
+    @classmethod
+    def from_json(cls, data):
+        return cls(
+            value=data.get('value'),
+            use_in_app_default=data.get('useInAppDefault'),
+            extra=_split(data, ('value', 'useInAppDefault')),
+        )
+
+    def json_fragment(self):
+        data = {}
+        if self.value is not None:
+            data['value'] = self.value
+        if self.use_in_app_default is not None:
+            data['useInAppDefault'] = self.use_in_app_default
+        data.update(self.extra)
+        return data
+
+
+class Parameter(Frozen):
+    """Tek bir Remote Config parametresi"""
+
+    __slots__ = ('default_value', 'conditional_values', 'value_type', 'description', 'extra')
+
+    @classmethod
+    def from_json(cls, data):
+        default_value = data.get('defaultValue')
+        conditional_values = data.get('conditionalValues')
+        return cls(
+            default_value=Value.from_json(default_value) if default_value is not None else None,
+            conditional_values=MappingProxyType({
+                name: Value.from_json(value) for name, value in conditional_values.items()
+            }) if conditional_values is not None else None,
+            value_type=data.get('valueType'),
+            description=data.get('description'),
+            extra=_split(data, ('defaultValue', 'conditionalValues', 'valueType', 'description')),
+        )
+
+    def json_fragment(self):
+        data = {}
+        if self.default_value is not None:
+            data['defaultValue'] = self.default_value
+        if self.conditional_values is not None:
+            data['conditionalValues'] = self.conditional_values
+        if self.description is not None:
+            data['description'] = self.description
+        if self.value_type is not None:
+            data['valueType'] = self.value_type
+        data.update(self.extra)
+        return data
+
+
+class Condition(Frozen):
+    """Template koşulu (name, expression, tagColor)"""
+
+    __slots__ = ('name', 'expression', 'tag_color', 'extra')
+
+    @classmethod
+    def from_json(cls, data):
+        return cls(
+            name=data.get('name'),
+            expression=data.get('expression'),
+            tag_color=data.get('tagColor'),
+            extra=_split(data, ('name', 'expression', 'tagColor')),
+        )
+
+    def json_fragment(self):
+        data = {}
+        if self.name is not None:
+            data['name'] = self.name
+        if self.expression is not None:
+            data['expression'] = self.expression
+        if self.tag_color is not None:
+            data['tagColor'] = self.tag_color
+        data.update(self.extra)
+        return data
+
+
+class Template(Frozen):
+    """Remote Config template'i
+
+    parameters isim → Parameter eşlemesidir; yeni template'ler değişmeyen
+    Parameter nesnelerini önceki template ile paylaşır. Kaynakta parameters
+    yoksa EMPTY'dir ve JSON'a yazılmaz.
+    """
+
+    __slots__ = ('parameters', 'conditions', 'parameter_groups', 'version', 'extra')
+
+    @classmethod
+    def from_json(cls, data):
+        parameters = data.get('parameters')
+        if parameters is not None:
+            parameters = {key: Parameter.from_json(param) for key, param in parameters.items()}
+        return cls._build(parameters, data)
+
+    @classmethod
+    def from_items(cls, items):
+        """remote_config_loader.iter_template çıktısından template oluştur
+
+        Parametreler geldikçe tek tek Parameter'a çevrilir; ham JSON'ın
+        tamamı bellekte tutulmaz.
+        """
+        parameters = None
+        sections = {}
+        for section, key, value in items:
+            if section != 'parameters':
+                sections[section] = value
+            elif key is None:
+                parameters = {}
+            else:
+                parameters[key] = Parameter.from_json(value)
+        return cls._build(parameters, sections)
+
+    @classmethod
+    def _build(cls, parameters, data):
+        conditions = data.get('conditions')
+        parameter_groups = data.get('parameterGroups')
+        version = data.get('version')
+        return cls(
+            parameters=MappingProxyType(parameters) if parameters is not None else EMPTY,
+            conditions=tuple(Condition.from_json(c) for c in conditions) if conditions is not None else None,
+            parameter_groups=_freeze(parameter_groups) if parameter_groups is not None else None,
+            version=_freeze(version) if version is not None else None,
+            extra=_split(data, ('parameters', 'conditions', 'parameterGroups', 'version')),
+        )
+
+    def json_fragment(self):
+        data = {}
+        if self.conditions is not None:
+            data['conditions'] = self.conditions
+        if self.parameters is not EMPTY:
+            data['parameters'] = self.parameters
+        if self.parameter_groups is not None:
+            data['parameterGroups'] = self.parameter_groups
+        if self.version is not None:
+            data['version'] = self.version
+        data.update(self.extra)
+        return data
+
+    def with_parameters(self, changes):
+        """Verilen parametreleri ekle/değiştir (None değeri parametreyi siler)"""
+        if not changes:
+            return self
+        parameters = dict(self.parameters)
+        for key, param in changes.items():
+            if param is None:
+                parameters.pop(key, None)
+            else:
+                parameters[key] = param
+        return self.replace(parameters=MappingProxyType(parameters))
+
+    def with_version(self, **fields):
+        """version alanlarını güncelle (ör: description)"""
+        version = dict(self.version or EMPTY)
+        version.update(fields)
+        return self.replace(version=_freeze(version))
+
+
+def json_default(obj):
+    """json_dumps için default hook; model nesnelerini kopyalamadan serileştirir"""
+    if isinstance(obj, Frozen):
+        return obj.json_fragment()
+    if isinstance(obj, MappingProxyType):
+        return dict(obj)
+    raise TypeError(f'{type(obj).__name__} JSON\'a dönüştürülemez')
+
+
+def merge_parameters(template, parameters):
+    """Yeni parametre değerlerini template'e uygula
+
+    Yeni template ile (eklenen, güncellenen) sayılarını döndürür. Değeri
+    değişmeyen parametreler yeni template'te aynı nesne olarak kalır.
+    """
+    changes = {}
+    added_count = 0
+    updated_count = 0
+
+    for key, param_config in parameters:
+        defaultValue = param_config.get('defaultValue', {}).get('value')
+        valueType = param_config.get('valueType', 'STRING')
+        description = param_config.get('description', '')
+
+        if not defaultValue and defaultValue != '0' and defaultValue != '':
+            continue
+
+        existing = template.parameters.get(key)
+        if existing is not None:
+            default_value = existing.default_value
+            if (
+                default_value is None
+                or default_value.value != str(defaultValue)
+                or default_value.use_in_app_default is not None
+                or default_value.extra
+            ):
+                default_value = Value(value=str(defaultValue))
+            param = existing.replace(
+                default_value=default_value,
+                value_type=valueType,
+                description=description or existing.description,
+            )
+            updated_count += 1
+        else:
+            param = Parameter(
+                default_value=Value(value=str(defaultValue)),
+                value_type=valueType,
+                description=description or None,
+            )
+            added_count += 1
+
+        if param is not existing:
+            changes[key] = param
+
+    return template.with_parameters(changes), added_count, updated_count
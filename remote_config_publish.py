@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+"""
+Remote Config Yayınlama
+Client (/remoteConfig) ve server (namespaces/firebase-server/serverRemoteConfig)
+template'lerini alır, birleştirir, doğrular ve yükler. Parametreler tek bir
+config dosyasında tanımlanır; remote_config_namespaces.json hangi key'in hangi
+template'e yansıtılacağını belirler. İki template eşzamanlı yayınlanır.
+"""
+
+import fnmatch
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import requests
+
+from remote_config_http import http_session
+from remote_config_loader import ResponseReader, iter_parameters, iter_template, json_dumps, load_template
+from remote_config_model import Template, json_default, merge_parameters
+from remote_config_validation import print_errors, validate_template
+
+API_ROOT = 'https://firebaseremoteconfig.googleapis.com/v1'
+NAMESPACE_PATHS = {
+    'client': 'projects/{project_id}/remoteConfig',
+    'server': 'projects/{project_id}/namespaces/firebase-server/serverRemoteConfig',
+}
+NAMESPACES_PATH = Path(__file__).parent / 'remote_config_namespaces.json'
+
+VERSION_DESCRIPTION = 'Amazon Rewards ve Points sistemi için Remote Config ayarları'
+
+# Geçici hatalarda (bağlantı, 429, 5xx) istek bu kadar kez tekrarlanır
+MAX_RETRIES = 3
+RETRY_BACKOFF_SECONDS = 1.0
+RETRY_STATUSES = frozenset((429, 500, 502, 503, 504))
+# ETag çakışmasında (409/412) template yeniden alınıp birleştirme tekrarlanır
+MAX_CONFLICT_RETRIES = 2
+CONFLICT_STATUSES = frozenset((409, 412))
+
+
+def template_url(project_id, namespace='client'):
+    """Namespace'e göre REST API adresi"""
+    return f'{API_ROOT}/{NAMESPACE_PATHS[namespace].format(project_id=project_id)}'
+
+
+def load_namespaces(path=NAMESPACES_PATH):
+    """namespace → {'include': [...], 'exclude': [...]}; dosya yoksa yalnızca client"""
+    if not Path(path).exists():
+        return {'client': {'include': ['*']}}
+    return load_template(path)
+
+
+def project_parameters(parameters, rule):
+    """Yalnızca namespace kuralına uyan parametreleri geçir"""
+    include = rule.get('include', ['*'])
+    exclude = rule.get('exclude', [])
+    for key, param in parameters:
+        if any(fnmatch.fnmatchcase(key, pattern) for pattern in include) and not any(
+            fnmatch.fnmatchcase(key, pattern) for pattern in exclude
+        ):
+            yield key, param
+
+
+def _phase(namespace, name):
+    # Client fazları eski kayıtlarla uyumlu kalsın diye öneksiz
+    return name if namespace == 'client' else f'{namespace}.{name}'
+
+
+def _request(method, url, phase, metrics=None, **kwargs):
+    """Geçici hatalarda üstel beklemeyle tekrar dene; son yanıtı döndür veya hatayı yükselt"""
+    for attempt in range(MAX_RETRIES + 1):
+        try:
+            response = http_session().request(method, url, **kwargs)
+        except (requests.ConnectionError, requests.Timeout):
+            if attempt == MAX_RETRIES:
+                raise
+        else:
+            if response.status_code not in RETRY_STATUSES or attempt == MAX_RETRIES:
+                return response
+            # stream=True isteklerinde bağlantı havuza ancak yanıt kapanınca döner
+            response.close()
+        if metrics:
+            metrics.retry(phase)
+        time.sleep(RETRY_BACKOFF_SECONDS * 2 ** attempt)
+
+
+def get_current_template(project_id, access_token, namespace='client', metrics=None):
+    """Mevcut Remote Config template'ini al"""
+    headers = {
+        'Authorization': f'Bearer {access_token}',
+        'Content-Type': 'application/json',
+    }
+
+    response = _request(
+        'GET', template_url(project_id, namespace), _phase(namespace, 'fetch'), metrics,
+        headers=headers, stream=True,
+    )
+
+    if response.status_code == 200:
+        # Gövde parça parça okunup parametreler geldikçe modele çevrilir
+        reader = ResponseReader(response)
+        with response:
+            template = Template.from_items(iter_template(reader))
+        if metrics:
+            metrics.payload(_phase(namespace, 'fetch'), reader.bytes_read)
+        return template, response.headers.get('ETag')
+    if metrics:
+        metrics.payload(_phase(namespace, 'fetch'), len(response.content))
+    if response.status_code == 404 and namespace != 'client':
+        # Server template henüz hiç yayınlanmamış; boş template'e koşulsuz yazılır
+        return Template.from_json({'parameters': {}}), '*'
+    if response.status_code == 404:
+        print('❌ Remote Config template bulunamadı')
+        print('   Firebase Console\'dan en az bir parametre ekleyin')
+        return None, None
+    print(f'❌ [{namespace}] Template alınamadı: HTTP {response.status_code}')
+    print(f'   Response: {response.text}')
+    return None, None
+
+
+def _put_template(project_id, access_token, template, etag, namespace='client', metrics=None):
+    headers = {
+        'Authorization': f'Bearer {access_token}',
+        'Content-Type': 'application/json',
+        'If-Match': etag,
+    }
+
+    body = json_dumps(template, default=json_default)
+    if metrics:
+        metrics.payload(_phase(namespace, 'publish'), len(body))
+    return _request(
+        'PUT', template_url(project_id, namespace), _phase(namespace, 'publish'), metrics,
+        headers=headers, data=body,
+    )
+
+
+def _deploy_result(response, namespace, metrics):
+    if response.status_code == 200:
+        return response.json()
+    if metrics and response.status_code in CONFLICT_STATUSES:
+        metrics.outcome = 'conflict'
+    print(f'❌ [{namespace}] Template yüklenemedi: HTTP {response.status_code}')
+    print(f'   Response: {response.text}')
+    return None
+
+
+def deploy_template(project_id, access_token, template, etag, namespace='client', metrics=None):
+    """Remote Config template'ini yükle"""
+    response = _put_template(project_id, access_token, template, etag, namespace, metrics)
+    return _deploy_result(response, namespace, metrics)
+
+
+def prepare_namespace(project_id, access_token, config_path, namespace, rule, metrics):
+    """Güncel template'i al ve config ile birleştir; (template, etag) veya (None, None)"""
+    label = f'[{namespace}]'
+
+    with metrics.phase(_phase(namespace, 'fetch')):
+        current_template, etag = get_current_template(project_id, access_token, namespace, metrics)
+    if current_template is None:
+        return None, None
+    print(f'📥 {label} Mevcut template alındı ({len(current_template.parameters)} parametre, ETag: {etag})')
+
+    with metrics.phase(_phase(namespace, 'merge')):
+        template, added_count, updated_count = merge_parameters(
+            current_template, project_parameters(iter_parameters(config_path), rule),
+        )
+    print(f'🔀 {label} {added_count} eklendi, {updated_count} güncellendi, toplam {len(template.parameters)}')
+    return template.with_version(description=VERSION_DESCRIPTION), etag
+
+
+def validate_namespace(namespace, template, metrics):
+    """Birleştirilmiş template'i doğrula; geçersizse hataları yazdırıp False döndür"""
+    with metrics.phase(_phase(namespace, 'validate')):
+        errors = validate_template(template)
+    if errors:
+        print(f'🔍 [{namespace}] Doğrulama başarısız')
+        print_errors(errors)
+        metrics.outcome = 'invalid'
+        return False
+    return True
+
+
+def push_namespace(project_id, access_token, config_path, namespace, rule, metrics, template, etag):
+    """Doğrulanmış template'i yükle
+
+    ETag çakışmasıyla reddedilirse güncel template yeniden alınıp birleştirilir,
+    doğrulanır ve en fazla MAX_CONFLICT_RETRIES kez tekrar denenir.
+    """
+    for attempt in range(MAX_CONFLICT_RETRIES + 1):
+        with metrics.phase(_phase(namespace, 'publish')):
+            response = _put_template(project_id, access_token, template, etag, namespace, metrics)
+        if response.status_code not in CONFLICT_STATUSES or attempt == MAX_CONFLICT_RETRIES:
+            break
+
+        print(f'🔁 [{namespace}] ETag çakışması, template yeniden alınıyor...')
+        metrics.retry(_phase(namespace, 'publish'))
+        template, etag = prepare_namespace(project_id, access_token, config_path, namespace, rule, metrics)
+        if template is None or not validate_namespace(namespace, template, metrics):
+            return None
+
+    result = _deploy_result(response, namespace, metrics)
+    if result:
+        print(f'📤 [{namespace}] Yüklendi (Version: {result.get("version", {}).get("versionNumber", "N/A")})')
+    return result
+
+
+def publish_namespace(project_id, access_token, config_path, namespace, rule, metrics):
+    """Tek bir namespace için al → birleştir → doğrula → yükle"""
+    template, etag = prepare_namespace(project_id, access_token, config_path, namespace, rule, metrics)
+    if template is None or not validate_namespace(namespace, template, metrics):
+        return None
+    return push_namespace(project_id, access_token, config_path, namespace, rule, metrics, template, etag)
+
+
+def publish_all(project_id, access_token, config_path, metrics, namespaces=None):
+    """Tüm namespace'leri yayınla; namespace → sonuç (başarısızsa None)
+
+    Alma/birleştirme ve yükleme namespace'ler arasında eşzamanlıdır. Doğrulama
+    arada ana thread'de yapılır: büyük template'lerde kullanılan process pool
+    çok thread'li süreçten fork edilmez ve önbellek tek yazarlı kalır.
+    """
+    rules = load_namespaces()
+    if namespaces is not None:
+        rules = {name: rules[name] for name in namespaces}
+
+    with ThreadPoolExecutor(max_workers=len(rules)) as pool:
+        futures = {
+            name: pool.submit(prepare_namespace, project_id, access_token, config_path, name, rule, metrics)
+            for name, rule in rules.items()
+        }
+        prepared = {name: future.result() for name, future in futures.items()}
+
+    results = {name: None for name in rules}
+    ready = {
+        name: (template, etag) for name, (template, etag) in prepared.items()
+        if template is not None and validate_namespace(name, template, metrics)
+    }
+    if not ready:
+        return results
+
+    with ThreadPoolExecutor(max_workers=len(ready)) as pool:
+        futures = {
+            name: pool.submit(
+                push_namespace, project_id, access_token, config_path, name, rules[name], metrics, template, etag,
+            )
+            for name, (template, etag) in ready.items()
+        }
+        results.update({name: future.result() for name, future in futures.items()})
+    return results
@@ -0,0 +1,290 @@
+#!/usr/bin/env python3
+"""
+Remote Config Kademeli Yayın (Staged Rollout)
+Riskli bir parametre değişikliğini defaultValue'yu hemen değiştirmek yerine
+percent koşullu bir conditionalValue olarak yayınlar ve adım adım büyütür
+(1% → 10% → 50% → 100%). Adımlar arasında sağlık probu (gecikme / hata oranı)
+sorgulanır; eşik aşılırsa değişiklik otomatik geri alınır.
+"""
+
+import argparse
+import sys
+import time
+from types import MappingProxyType
+
+import requests
+
+from remote_config_http import http_session
+from remote_config_metrics import start_run
+from remote_config_model import EMPTY, Condition, Value
+from remote_config_publish import deploy_template, get_current_template
+from remote_config_validation import print_errors, validate_template
+
+DEFAULT_STEPS = (1, 10, 50, 100)
+DEFAULT_INTERVAL_SECONDS = 600
+CONDITION_PREFIX = 'rollout_'
+TAG_COLOR = 'ORANGE'
+
+
+class HealthSample:
+    """Probun döndürdüğü tek ölçüm"""
+
+    __slots__ = ('latency_ms', 'error_rate')
+
+    def __init__(self, latency_ms, error_rate):
+        self.latency_ms = latency_ms
+        self.error_rate = error_rate
+
+    def __repr__(self):
+        return f'HealthSample(latency_ms={self.latency_ms}, error_rate={self.error_rate})'
+
+
+class StaticProbe:
+    """Sabit veya sıralı değerler döndüren yerel prob (test ve deneme için)"""
+
+    def __init__(self, samples):
+        self._samples = list(samples)
+
+    def check(self, key, percent):
+        if len(self._samples) > 1:
+            return self._samples.pop(0)
+        return self._samples[0]
+
+
+class HttpProbe:
+    """{"latency_ms": ..., "error_rate": ...} döndüren bir endpoint'i sorgular"""
+
+    def __init__(self, url, timeout=10):
+        self.url = url
+        self.timeout = timeout
+
+    def check(self, key, percent):
+        response = http_session().get(
+            self.url, params={'parameter': key, 'percent': percent}, timeout=self.timeout,
+        )
+        response.raise_for_status()
+        data = response.json()
+        return HealthSample(float(data['latency_ms']), float(data['error_rate']))
+
+
+def condition_name(key):
+    return f'{CONDITION_PREFIX}{key}'
+
+
+def with_rollout(template, key, value, percent):
+    """Key için percent koşulunu ve conditionalValue'yu ekle/güncelle"""
+    name = condition_name(key)
+    condition = Condition(
+        name=name,
+        expression=f"percent('{key}') <= {percent}",
+        tag_color=TAG_COLOR,
+    )
+    # Rollout koşulu en yüksek öncelikte değerlendirilsin diye başa eklenir
+    conditions = (condition,) + tuple(c for c in template.conditions or () if c.name != name)
+
+    param = template.parameters.get(key)
+    if param is None:
+        raise KeyError(f'{key} template\'te yok; önce normal deploy ile ekleyin')
+    conditional_values = dict(param.conditional_values or EMPTY)
+    conditional_values[name] = Value(value=value)
+    param = param.replace(conditional_values=MappingProxyType(conditional_values))
+
+    return template.replace(conditions=conditions).with_parameters({key: param})
+
+
+def without_rollout(template, key, default_value=None):
+    """Rollout koşulunu kaldır; default_value verilirse kalıcı değer yapılır"""
+    name = condition_name(key)
+    conditions = tuple(c for c in template.conditions or () if c.name != name)
+
+    param = template.parameters.get(key)
+    if param is None:
+        raise KeyError(f'{key} template\'te yok (rollout sırasında silinmiş)')
+    conditional_values = {
+        condition: value for condition, value in (param.conditional_values or EMPTY).items()
+        if condition != name
+    }
+    changes = {'conditional_values': MappingProxyType(conditional_values) if conditional_values else None}
+    if default_value is not None:
+        changes['default_value'] = Value(value=default_value)
+    param = param.replace(**changes)
+
+    return template.replace(conditions=conditions or None).with_parameters({key: param})
+
+
+def _publish(project_id, access_token, update, description, metrics, validate=True):
+    """Güncel template'i al, update uygula, doğrula ve yükle
+
+    Her adımda template ve ETag yeniden alınır; adımlar arasında başkasının
+    yaptığı değişiklikler ezilmez.
+    """
+    try:
+        current_template, etag = get_current_template(project_id, access_token, metrics=metrics)
+        if current_template is None:
+            return False
+        template = update(current_template).with_version(description=description)
+        if validate:
+            errors = validate_template(template)
+            if errors:
+                print_errors(errors)
+                return False
+        return deploy_template(project_id, access_token, template, etag, metrics=metrics) is not None
+    except KeyError as e:
+        print(f'❌ {e.args[0]}')
+        return False
+    except requests.RequestException as e:
+        print(f'❌ Remote Config isteği başarısız: {e}')
+        return False
+
+
+def _rollback(project_id, access_token, key, metrics):
+    """Rollout koşulunu kaldır; herkes yeniden eski defaultValue'yu alır
+
+    Doğrulama atlanır: Console'dan yapılmış başka bir geçersiz değişiklik
+    geri almayı engellememeli.
+    """
+    with metrics.phase('rollout.rollback'):
+        rolled_back = _publish(
+            project_id, access_token,
+            lambda template: without_rollout(template, key),
+            f'Rollout geri alındı: {key}', metrics, validate=False,
+        )
+    return 'rolled_back' if rolled_back else 'error'
+
+
+def _has_parameter(project_id, access_token, key, metrics):
+    """Key canlı template'te var mı? (ilk adımdan önce kontrol edilir)"""
+    try:
+        template, _ = get_current_template(project_id, access_token, metrics=metrics)
+    except requests.RequestException as e:
+        print(f'❌ Remote Config isteği başarısız: {e}')
+        return False
+    if template is None:
+        return False
+    if key not in template.parameters:
+        print(f'❌ {key} template\'te yok; önce normal deploy ile ekleyin')
+        return False
+    return True
+
+
+def _check_health(probe, key, percent, max_latency_ms, max_error_rate):
+    """Probu sorgula; prob hata verirse sağlıksız say"""
+    try:
+        sample = probe.check(key, percent)
+    except Exception as e:
+        print(f'🩺 Sağlık probu başarısız: {e}')
+        return False
+    print(f'🩺 Gecikme: {sample.latency_ms} ms, hata oranı: {sample.error_rate}')
+    return not (
+        (max_latency_ms is not None and sample.latency_ms > max_latency_ms)
+        or (max_error_rate is not None and sample.error_rate > max_error_rate)
+    )
+
+
+def run_rollout(project_id, access_token, key, value, probe, metrics,
+                steps=DEFAULT_STEPS, interval=DEFAULT_INTERVAL_SECONDS,
+                max_latency_ms=None, max_error_rate=None, sleep=time.sleep):
+    """Rollout'u adım adım uygula; 'success', 'rolled_back' veya 'error' döndürür
+
+    İlk adım yayınlandıktan sonraki her hata (eşik aşımı, prob hatası,
+    yayınlanamayan adım) değişikliği geri alır; kısmi rollout canlıda kalmaz.
+    """
+    with metrics.phase('rollout.check'):
+        if not _has_parameter(project_id, access_token, key, metrics):
+            return 'error'
+
+    live = False
+    for percent in steps:
+        if percent >= 100:
+            break
+
+        print(f'📶 {key}: %{percent} kullanıcıya yayınlanıyor...')
+        with metrics.phase('rollout.publish'):
+            published = _publish(
+                project_id, access_token,
+                lambda template: with_rollout(template, key, value, percent),
+                f'Rollout: {key} %{percent}', metrics,
+            )
+        if not published:
+            if not live:
+                return 'error'
+            print(f'🚨 %{percent} adımı yayınlanamadı, geri alınıyor...')
+            return _rollback(project_id, access_token, key, metrics)
+        live = True
+
+        print(f'⏳ {interval} sn bekleniyor...')
+        sleep(interval)
+
+        with metrics.phase('rollout.probe'):
+            healthy = _check_health(probe, key, percent, max_latency_ms, max_error_rate)
+        if not healthy:
+            print(f'🚨 Sağlık kontrolü başarısız, %{percent} adımında geri alınıyor...')
+            return _rollback(project_id, access_token, key, metrics)
+
+    print(f'✅ {key}: %100 — defaultValue olarak kalıcı yapılıyor...')
+    with metrics.phase('rollout.publish'):
+        finalized = _publish(
+            project_id, access_token,
+            lambda template: without_rollout(template, key, default_value=value),
+            f'Rollout tamamlandı: {key}', metrics,
+        )
+    if finalized:
+        return 'success'
+    if not live:
+        return 'error'
+    print('🚨 %100 adımı yayınlanamadı, geri alınıyor...')
+    return _rollback(project_id, access_token, key, metrics)
+
+
+def _parse_steps(text):
+    steps = tuple(int(step) for step in text.split(','))
+    if any(not 0 < step <= 100 for step in steps) or list(steps) != sorted(steps):
+        raise argparse.ArgumentTypeError('Adımlar 1-100 arasında ve artan sırada olmalı')
+    return steps
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Remote Config kademeli yayın')
+    parser.add_argument('key', help='Parametre adı (ör: max_daily_notifications)')
+    parser.add_argument('value', help='Yeni değer')
+    parser.add_argument('--steps', type=_parse_steps, default=DEFAULT_STEPS, help='Ör: 1,10,50,100')
+    parser.add_argument('--interval', type=float, default=DEFAULT_INTERVAL_SECONDS, help='Adımlar arası bekleme (sn)')
+    parser.add_argument('--probe-url', help='Sağlık endpoint\'i; verilmezse prob her zaman sağlıklı döner')
+    parser.add_argument('--max-latency-ms', type=float, help='Geri alma için gecikme eşiği')
+    parser.add_argument('--max-error-rate', type=float, help='Geri alma için hata oranı eşiği (0-1)')
+    args = parser.parse_args()
+    if args.probe_url and args.max_latency_ms is None and args.max_error_rate is None:
+        parser.error('--probe-url ile en az bir eşik gerekli (--max-latency-ms / --max-error-rate)')
+
+    from deploy_remote_config_final import get_firebase_access_token, get_firebase_project_id
+
+    metrics = start_run('remote_config_rollout')
+    project_id = get_firebase_project_id()
+    metrics.project = project_id
+    print(f'📋 Project ID: {project_id}')
+
+    with metrics.phase('auth'):
+        access_token = get_firebase_access_token()
+    if not access_token:
+        sys.exit(1)
+
+    if args.probe_url:
+        probe = HttpProbe(args.probe_url)
+    else:
+        print('⚠️  --probe-url verilmedi, sağlık kontrolü yapılmayacak')
+        probe = StaticProbe([HealthSample(0.0, 0.0)])
+
+    outcome = run_rollout(
+        project_id, access_token, args.key, args.value, probe, metrics,
+        steps=args.steps, interval=args.interval,
+        max_latency_ms=args.max_latency_ms, max_error_rate=args.max_error_rate,
+    )
+    metrics.outcome = outcome
+    if outcome != 'success':
+        print(f'❌ Rollout tamamlanmadı: {outcome}')
+        sys.exit(1)
+    print('🎉 Rollout tamamlandı!')
+
+
+if __name__ == '__main__':
+    main()
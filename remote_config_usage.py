@@ -0,0 +1,404 @@
+#!/usr/bin/env python3
+"""
+Remote Config Kullanım İndeksi
+lib/ altındaki Dart kaynaklarını tarar, hangi Remote Config key'inin nereden
+okunduğunu indeksler. Okuyucusu olmayan (ölü) parametreleri ve template'te
+olmayan key okumalarını raporlar. --prune ölü parametreleri çıkarılmış template'i
+dosyaya yazar (Console'dan elle içe aktarmak için); --publish ise canlı client
+template'ini ETag ile alıp ölü parametreler olmadan yeniden yayınlar (önce
+çıkarılacak key'leri gösterip onay ister; --dry-run yalnızca gösterir).
+"""
+
+import argparse
+import os
+import re
+import sys
+from pathlib import Path
+
+from remote_config_loader import dump_template, json_dumps, load_template
+from remote_config_model import Template, json_default
+
+DART_ROOT = Path(__file__).parent / 'lib'
+CACHE_PATH = Path(__file__).parent / '.remote_config_usage_cache.json'
+# scan_file çıktısı değiştiğinde artırılır; eski önbellek kayıtları yeniden taranır
+SCANNER_VERSION = 2
+
+# _remoteConfig!.getInt('key'), FirebaseRemoteConfig.instance.getString(paramKey) ...
+READ_RE = re.compile(
+    r'\w*[Rr]emoteConfig\w*[!?]?(?:\.instance)?\s*\.\s*'
+    r'(?:getString|getInt|getBool|getDouble|getValue)\(\s*([^)]*?)\s*\)'
+)
+STRING_RE = re.compile(r"'([^'\\\n]*)'|\"([^\"\\\n]*)\"")
+IDENTIFIER_RE = re.compile(r'[A-Za-z_]\w*')
+CALL_RE = re.compile(r'(?<![\w$])([a-z_]\w*)\s*\(')
+# Dönüş tipi + isim + '(' ile başlayan satırlar: int getPointReferral() {, Future<void> initialize() async {
+METHOD_RE = re.compile(
+    r'^\s*(?:(?:static|external|@override)\s+)*([\w$]+(?:<[^()=;]*>)?\??)\s+([a-z_]\w*)\s*\('
+)
+# Getter/setter'lar: bool get isEnabled => ..., int get limit {, set limit(int value) {
+ACCESSOR_RE = re.compile(
+    r'^\s*(?:(?:static|external|@override)\s+)*(?:[\w$]+(?:<[^()=;]*>)?\??\s+)?'
+    r'(get|set)\s+([a-z_]\w*)\s*(?:=>|\{|\(|async\b)'
+)
+KEYWORDS = frozenset((
+    'if', 'for', 'while', 'switch', 'catch', 'return', 'assert', 'super', 'this',
+    'await', 'else', 'new', 'throw', 'yield', 'case', 'final', 'var', 'const',
+))
+
+
+def _strings(text):
+    return [single or double for single, double in STRING_RE.findall(text)]
+
+
+def _line_starts(text):
+    starts = [0]
+    for match in re.finditer('\n', text):
+        starts.append(match.end())
+    return starts
+
+
+def _line_of(starts, offset):
+    """Offset'in 1 tabanlı satır numarası (ikili arama)"""
+    low, high = 0, len(starts)
+    while low < high - 1:
+        mid = (low + high) // 2
+        if starts[mid] <= offset:
+            low = mid
+        else:
+            high = mid
+    return low + 1
+
+
+def _resolve_keys(text, argument, offset):
+    """Okuma argümanından key(ler)i çıkar; değişkense son atamasına bak"""
+    keys = _strings(argument)
+    if keys or not IDENTIFIER_RE.fullmatch(argument):
+        return keys
+    assignments = list(re.finditer(rf'\b{re.escape(argument)}\s*=(?!=)([^;]*);', text[:offset]))
+    if not assignments:
+        return []
+    expression = assignments[-1].group(1)
+    # languageCode == 'tr' ? 'notification_messages_tr' : ... → yalnızca ternary dalları
+    if '?' in expression:
+        expression = expression.split('?', 1)[1]
+    return _strings(expression)
+
+
+def _body_end(text, offset):
+    """Bildirimin gövdesinin bittiği offset: {...} bloğu veya => ifadesinin ;'ü
+
+    Dengeli bir son bulunamazsa None döner (kapsam belirsiz).
+    """
+    depth = 0
+    quote = None
+    index = offset
+    while index < len(text):
+        ch = text[index]
+        if quote:
+            if ch == '\\':
+                index += 1
+            elif ch == quote:
+                quote = None
+        elif ch in '\'"':
+            quote = ch
+        elif text.startswith('//', index) or text.startswith('/*', index):
+            index = text.find('\n' if text[index + 1] == '/' else '*/', index)
+            if index < 0:
+                return None
+        elif ch in '({[':
+            depth += 1
+        elif ch in ')}]':
+            depth -= 1
+            if depth < 0:
+                return None
+            if depth == 0 and ch == '}':
+                return index + 1
+        elif ch == ';' and depth == 0:
+            return index + 1
+        index += 1
+    return None
+
+
+def scan_file(path):
+    """Tek bir Dart dosyasındaki okumaları, metot tanımlarını ve çağrıları çıkar
+
+    Okuma, gövdesi onu kapsayan en içteki metoda yazılır. Getter/setter
+    erişimleri çağrı olarak izlenemediği, alan başlatıcıları veya gövdesi
+    çözülemeyen metotlardaki okumalar da kime ait olduğu belirsiz olduğu için
+    metotsuz (canlı) sayılır.
+    """
+    text = Path(path).read_text(encoding='utf-8', errors='replace')
+    starts = _line_starts(text)
+    lines = text.split('\n')
+
+    members = []
+    calls = {}
+    for number, line in enumerate(lines, 1):
+        stripped = line.lstrip()
+        if stripped.startswith('//') or stripped.startswith('*'):
+            continue
+        line = line.split(' // ', 1)[0]
+        declared = None
+        accessor = ACCESSOR_RE.match(line)
+        declaration = None if accessor else METHOD_RE.match(line)
+        if accessor:
+            declared = accessor
+            members.append((starts[number - 1] + accessor.start(1), None))
+        elif declaration and declaration.group(1) not in KEYWORDS and '=' not in line[:declaration.end()]:
+            declared = declaration
+            members.append((starts[number - 1] + declaration.start(2), declaration.group(2)))
+        for match in CALL_RE.finditer(line):
+            name = match.group(1)
+            if name in KEYWORDS or (declared and match.start(1) == declared.start(2)):
+                continue
+            calls.setdefault(name, []).append(number)
+
+    spans = []
+    for start, name in members:
+        end = _body_end(text, start)
+        if end is not None:
+            spans.append((start, end, name))
+
+    reads = []
+    for match in READ_RE.finditer(text):
+        line = _line_of(starts, match.start())
+        if lines[line - 1].lstrip().startswith('//'):
+            continue
+        enclosing = None
+        for start, end, name in spans:
+            if start > match.start():
+                break
+            if match.start() < end:
+                enclosing = name
+        for key in _resolve_keys(text, match.group(1), match.start()):
+            reads.append([key, line, enclosing])
+
+    return {'reads': reads, 'calls': calls}
+
+
+def _load_cache(path):
+    try:
+        return load_template(path)
+    except (OSError, ValueError):
+        return {}
+
+
+def build_index(root=DART_ROOT, cache_path=CACHE_PATH):
+    """Tüm Dart dosyalarını tara; değişmeyen dosyalar önbellekten (mtime) okunur"""
+    cache = _load_cache(cache_path) if cache_path else {}
+    files = {}
+    rescanned = 0
+
+    for directory, _, names in os.walk(root):
+        for name in names:
+            if not name.endswith('.dart'):
+                continue
+            path = os.path.join(directory, name)
+            stat = os.stat(path)
+            signature = [SCANNER_VERSION, stat.st_mtime_ns, stat.st_size]
+            cached = cache.get(path)
+            if cached is None or cached['signature'] != signature:
+                cached = {'signature': signature, **scan_file(path)}
+                rescanned += 1
+            files[path] = cached
+
+    if cache_path and (rescanned or len(files) != len(cache)):
+        with open(cache_path, 'wb') as f:
+            f.write(json_dumps(files))
+
+    return UsageIndex(files)
+
+
+class UsageIndex:
+    """key → okuma yerleri ve metot → çağrı yerleri indeksi"""
+
+    def __init__(self, files):
+        self.reads = {}
+        self.calls = {}
+        for path, scanned in files.items():
+            for key, line, method in scanned['reads']:
+                self.reads.setdefault(key, []).append((path, line, method))
+            for name, lines in scanned['calls'].items():
+                self.calls.setdefault(name, []).extend((path, line) for line in lines)
+
+    def call_sites(self, key):
+        """Key'i okuyan metotların çağrıldığı yerler"""
+        sites = []
+        for _, _, method in self.reads.get(key, ()):
+            if method is not None:
+                sites.extend(self.calls.get(method, ()))
+        return sites
+
+    def is_read(self, key):
+        """Key doğrudan (metot dışından) okunuyor ya da okuyan metot çağrılıyor mu?"""
+        direct = self.reads.get(key)
+        if not direct:
+            return False
+        return any(method is None or method in self.calls for _, _, method in direct)
+
+    def dead_parameters(self, template):
+        """Template'te olup uygulamada okunmayan parametreler"""
+        return sorted(key for key in template.parameters if not self.is_read(key))
+
+    def unknown_reads(self, template):
+        """Uygulamada okunup template'te olmayan key'ler"""
+        return sorted(key for key in self.reads if key not in template.parameters)
+
+
+def prune_dead_parameters(template, index):
+    """Ölü parametreleri çıkarılmış yeni template döndür"""
+    return template.with_parameters({key: None for key in index.dead_parameters(template)})
+
+
+def publish_pruned(project_id, access_token, index, metrics=None, confirm=None):
+    """Canlı client template'inden ölü parametreleri çıkarıp yayınla
+
+    Çıkarılacak key'ler yüklemeden önce yazdırılır; confirm verilirse
+    (key listesi ile çağrılır) False döndüğünde yükleme yapılmaz. Çıkarılan
+    key listesini (yayın yapılmadıysa boş liste), alma/doğrulama/yükleme
+    başarısızsa None döndürür. Server template'i lib/ tarafından okunmadığı
+    için dokunulmaz.
+    """
+    from remote_config_publish import deploy_template, get_current_template
+    from remote_config_validation import print_errors, validate_template
+
+    template, etag = get_current_template(project_id, access_token, metrics=metrics)
+    if template is None:
+        return None
+    dead = index.dead_parameters(template)
+    if not dead:
+        return []
+
+    pruned = prune_dead_parameters(template, index).with_version(
+        description=f'Okunmayan {len(dead)} parametre çıkarıldı',
+    )
+    errors = validate_template(pruned)
+    if errors:
+        print_errors(errors)
+        return None
+
+    print(f'🪦 Canlı template\'ten çıkarılacak {len(dead)} parametre:')
+    for key in dead:
+        print(f'   - {key}')
+    if confirm is not None and not confirm(dead):
+        return []
+    if deploy_template(project_id, access_token, pruned, etag, metrics=metrics) is None:
+        return None
+    return dead
+
+
+def _ask_confirmation(dead):
+    try:
+        answer = input(f'❓ {len(dead)} parametre canlı template\'ten silinsin mi? [e/H] ')
+    except EOFError:
+        return False
+    return answer.strip().lower() in ('e', 'evet', 'y', 'yes')
+
+
+def _dry_run(dead):
+    print('🧪 Dry run: canlı template değiştirilmedi')
+    return False
+
+
+def _relative(path):
+    try:
+        return os.path.relpath(path, Path(__file__).parent)
+    except ValueError:
+        return path
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Remote Config key kullanım raporu')
+    parser.add_argument('template', nargs='?', help='Remote Config template dosyası (--publish ile gerekmez)')
+    parser.add_argument('--prune', metavar='OUTPUT',
+                        help='Ölü parametreleri çıkarıp bu dosyaya yaz (yalnızca dosya; '
+                             'deploy script\'leri key silmez, Console\'dan elle içe aktarılmalı)')
+    parser.add_argument('--publish', action='store_true',
+                        help='Ölü parametreleri canlı client template\'inden çıkarıp yayınla')
+    parser.add_argument('--dry-run', action='store_true',
+                        help='--publish ile: çıkarılacak key\'leri göster, yayınlama')
+    parser.add_argument('--yes', action='store_true', help='--publish ile: onay sormadan yayınla')
+    parser.add_argument('--verbose', action='store_true', help='Her key için okuma yerlerini göster')
+    args = parser.parse_args()
+    if not args.template and not args.publish:
+        parser.error('template dosyası veya --publish gerekli')
+    if (args.dry_run or args.yes) and not args.publish:
+        parser.error('--dry-run ve --yes yalnızca --publish ile kullanılabilir')
+
+    index = build_index()
+    if args.publish:
+        from deploy_remote_config_final import get_firebase_access_token, get_firebase_project_id
+        from remote_config_metrics import start_run
+        from remote_config_publish import get_current_template
+
+        metrics = start_run('remote_config_usage')
+        project_id = get_firebase_project_id()
+        metrics.project = project_id
+        with metrics.phase('auth'):
+            access_token = get_firebase_access_token()
+        if not access_token:
+            sys.exit(1)
+        template, _ = get_current_template(project_id, access_token)
+        if template is None:
+            sys.exit(1)
+    else:
+        template = Template.from_json(load_template(args.template))
+    dead = index.dead_parameters(template)
+    unknown = index.unknown_reads(template)
+
+    print(f'📊 Template parametre sayısı: {len(template.parameters)}')
+    print(f'📊 Uygulamada okunan key sayısı: {len(index.reads)}')
+    print()
+
+    if args.verbose:
+        for key in sorted(template.parameters):
+            print(f'🔑 {key}')
+            for path, line, method in index.reads.get(key, ()):
+                print(f'   📖 {_relative(path)}:{line} ({method or "-"})')
+            for path, line in index.call_sites(key):
+                print(f'   📞 {_relative(path)}:{line}')
+        print()
+
+    if dead:
+        print(f'🪦 Okunmayan {len(dead)} parametre:')
+        for key in dead:
+            print(f'   - {key}')
+        print()
+    else:
+        print('✅ Tüm parametreler uygulamada okunuyor')
+        print()
+
+    if unknown:
+        print(f'⚠️  Template\'te olmayan {len(unknown)} key okunuyor:')
+        for key in unknown:
+            for path, line, _ in index.reads[key]:
+                print(f'   - {key} ({_relative(path)}:{line})')
+        print()
+
+    if args.prune:
+        pruned = prune_dead_parameters(template, index)
+        dump_template(pruned, args.prune, default=json_default)
+        print(f'✂️  {len(dead)} parametre çıkarıldı: {args.prune}')
+        print('   Not: deploy script\'leri key silmez; dosyayı Console\'dan içe aktarın veya --publish kullanın')
+
+    if args.publish:
+        if args.dry_run:
+            confirm = _dry_run
+        else:
+            confirm = None if args.yes else _ask_confirmation
+        with metrics.phase('publish'):
+            removed = publish_pruned(project_id, access_token, index, metrics, confirm=confirm)
+        if removed is None:
+            sys.exit(1)
+        metrics.outcome = 'success'
+        if removed:
+            print(f'📤 Canlı template\'ten {len(removed)} parametre çıkarıldı')
+        elif dead and not args.dry_run:
+            print('⏹️  Yayın iptal edildi')
+
+    if unknown:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
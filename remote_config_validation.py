@@ -0,0 +1,337 @@
+#!/usr/bin/env python3
+"""
+Remote Config Değer Doğrulama
+remote_config_schema.json'daki kuralları bir kez derler, yayınlamadan önce
+tüm default ve conditional değerleri kontrol eder.
+"""
+
+import fnmatch
+import hashlib
+import json
+import math
+import os
+import re
+import sys
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from remote_config_loader import json_dumps, json_loads, load_template
+from remote_config_model import EMPTY, Template
+
+SCHEMA_PATH = Path(__file__).parent / 'remote_config_schema.json'
+CACHE_PATH = Path(os.environ.get(
+    'REMOTE_CONFIG_VALIDATION_CACHE',
+    Path(__file__).parent / '.remote_config_validation_cache.json',
+))
+
+# Bu sayının üzerindeki değerler process pool ile doğrulanır
+PARALLEL_THRESHOLD = 2000
+PARALLEL_CHUNK_SIZE = 500
+
+# Önbellekte en son görülen bu kadar hash tutulur
+CACHE_LIMIT = 20000
+
+# Doğrulama mantığı değiştiğinde artırılır; eski önbellek kayıtları geçersiz olur
+RULES_VERSION = 2
+
+BOOLEAN_VALUES = ('true', 'false')
+
+# Uygulama tam sayıları int.tryParse ile okur: yalnızca işaret ve rakam
+INTEGER_RE = re.compile(r'[+-]?\d+', re.ASCII)
+
+
+def _short(value, limit=60):
+    """Hata mesajları için uzun değerleri kısalt"""
+    return repr(value if len(value) <= limit else value[:limit] + '…')
+
+
+def _check_number(value):
+    try:
+        number = float(value)
+    except ValueError:
+        return None, f'sayı değil: {_short(value)}'
+    if not math.isfinite(number):
+        return None, f'sonlu bir sayı değil: {_short(value)}'
+    return number, None
+
+
+def _check_boolean(value):
+    if value not in BOOLEAN_VALUES:
+        return None, f'true/false değil: {_short(value)}'
+    return value, None
+
+
+def _check_json(value):
+    try:
+        return json_loads(value), None
+    except ValueError as e:
+        return None, f'geçersiz JSON: {e}'
+
+
+def _check_string(value):
+    return value, None
+
+
+VALUE_TYPE_CHECKS = {
+    'NUMBER': _check_number,
+    'BOOLEAN': _check_boolean,
+    'JSON': _check_json,
+    'STRING': _check_string,
+    'PARAMETER_VALUE_TYPE_UNSPECIFIED': _check_string,
+}
+
+
+def _compile_constraints(rule):
+    """min/max/integer/enum/pattern kurallarını tek bir fonksiyona derle"""
+    checks = []
+
+    if rule.get('integer') or 'min' in rule or 'max' in rule:
+        integer = rule.get('integer', False)
+        minimum = rule.get('min')
+        maximum = rule.get('max')
+
+        def check_range(value):
+            if integer and not INTEGER_RE.fullmatch(value.strip()):
+                return f'tam sayı değil: {_short(value)}'
+            number, error = _check_number(value)
+            if error:
+                return error
+            if minimum is not None and number < minimum:
+                return f'{value} < {minimum}'
+            if maximum is not None and number > maximum:
+                return f'{value} > {maximum}'
+            return None
+
+        checks.append(check_range)
+
+    if 'enum' in rule:
+        allowed = frozenset(rule['enum'])
+        checks.append(lambda value: None if value in allowed else f'izin verilmeyen değer: {_short(value)}')
+
+    if 'pattern' in rule:
+        pattern = re.compile(rule['pattern'])
+        checks.append(lambda value: None if pattern.fullmatch(value) else f'formata uymuyor: {_short(value)}')
+
+    if 'items' in rule:
+        items_rule = rule['items']
+        separator = items_rule.get('separator', ',')
+        check_item = _compile_constraints(items_rule)
+
+        def check_items(value):
+            for item in value.split(separator):
+                item = item.strip()
+                if not item:
+                    # Uygulama boş satırları atlıyor (ör: sondaki \n)
+                    continue
+                error = check_item(item)
+                if error:
+                    return f'liste elemanı {error}'
+            return None
+
+        checks.append(check_items)
+
+    def check(value):
+        for constraint in checks:
+            error = constraint(value)
+            if error:
+                return error
+        return None
+
+    return check
+
+
+class CompiledSchema:
+    """Derlenmiş doğrulayıcılar; parametre adına göre önbelleklenir"""
+
+    def __init__(self, schema):
+        self.exact = {}
+        self.wildcards = []
+        for key, rule in schema.get('parameters', {}).items():
+            compiled = (
+                json.dumps(rule, sort_keys=True),
+                rule.get('valueType'),
+                _compile_constraints(rule),
+            )
+            if any(ch in key for ch in '*?['):
+                self.wildcards.append((key, compiled))
+            else:
+                self.exact[key] = compiled
+        self._resolved = {}
+
+    def rule_for(self, key):
+        """Parametreye uyan ilk kuralı döndür (tam eşleşme öncelikli)"""
+        if key not in self._resolved:
+            rule = self.exact.get(key)
+            if rule is None:
+                rule = next(
+                    (compiled for pattern, compiled in self.wildcards if fnmatch.fnmatchcase(key, pattern)),
+                    None,
+                )
+            self._resolved[key] = rule
+        return self._resolved[key]
+
+    def validate_value(self, key, value_type, value):
+        """Tek bir değeri doğrula, hata mesajı veya None döndür"""
+        rule = self.rule_for(key)
+        if rule is not None:
+            _, expected_type, constraints = rule
+            if expected_type and expected_type != value_type:
+                return f'valueType {value_type}, şemada {expected_type}'
+        else:
+            constraints = None
+
+        _, error = VALUE_TYPE_CHECKS.get(value_type, _check_string)(value)
+        if error:
+            return error
+        if constraints is not None:
+            return constraints(value)
+        return None
+
+    def cache_key(self, key, value_type, value):
+        """Değer ve ona uygulanan kuralın hash'i"""
+        rule = self.rule_for(key)
+        digest = hashlib.sha1()
+        for part in (str(RULES_VERSION), rule[0] if rule else '', value_type, value):
+            digest.update(part.encode('utf-8'))
+            digest.update(b'\0')
+        return digest.hexdigest()
+
+
+def load_schema(path=SCHEMA_PATH):
+    """Şemayı yükle ve derle"""
+    if not Path(path).exists():
+        return CompiledSchema({})
+    return CompiledSchema(load_template(path))
+
+
+def iter_values(template):
+    """Template'teki tüm (parametre, koşul, valueType, değer) kayıtlarını üret"""
+    if isinstance(template, dict):
+        template = Template.from_json(template)
+    for key, param in template.parameters.items():
+        value_type = param.value_type or 'STRING'
+        if param.default_value is not None and param.default_value.value is not None:
+            yield key, None, value_type, param.default_value.value
+        for condition, conditional in (param.conditional_values or EMPTY).items():
+            if conditional.value is not None:
+                yield key, condition, value_type, conditional.value
+
+
+def _load_cache(path):
+    """Geçerli değer hash'leri, en son görülen başta"""
+    try:
+        return load_template(path)
+    except (OSError, ValueError):
+        return []
+
+
+def _save_cache(path, cache, seen):
+    """Bu çalışmada görülen hash'leri başa al, listeyi CACHE_LIMIT ile sınırla"""
+    seen_set = set(seen)
+    updated = (list(seen) + [digest for digest in cache if digest not in seen_set])[:CACHE_LIMIT]
+    if updated == cache:
+        return
+    # Eşzamanlı yayınlarda yarım yazılmış dosya okunmasın diye atomik değiştir
+    temp_path = f'{path}.{os.getpid()}.{threading.get_ident()}.tmp'
+    with open(temp_path, 'wb') as f:
+        f.write(json_dumps(updated))
+    os.replace(temp_path, path)
+
+
+# Aynı süreçte eşzamanlı doğrulamalar (ör: client + server yayını) önbelleği
+# birbirinin üzerine yazmasın diye kaydetme bu kilitle yapılır
+_cache_lock = threading.Lock()
+
+_worker_schema = None
+
+
+def _init_worker(schema_path):
+    global _worker_schema
+    _worker_schema = load_schema(schema_path)
+
+
+def _validate_chunk(entries):
+    return [(entry, _worker_schema.validate_value(entry[0], entry[2], entry[3])) for entry in entries]
+
+
+def validate_template(template, schema_path=SCHEMA_PATH, cache_path=None):
+    """Template'i doğrula, [(parametre, koşul, hata)] listesi döndür
+
+    Daha önce geçerli bulunan değerler hash'leri ile önbellekte tutulur ve
+    tekrar kontrol edilmez. Önbellek en son görülen CACHE_LIMIT hash ile
+    sınırlıdır. cache_path verilmezse CACHE_PATH çağrı anında okunur; False
+    önbelleği kapatır.
+    """
+    if cache_path is None:
+        cache_path = CACHE_PATH
+    schema = load_schema(schema_path)
+    cache = _load_cache(cache_path) if cache_path else []
+    cached = set(cache)
+
+    pending = []
+    valid = []
+    for entry in iter_values(template):
+        digest = schema.cache_key(entry[0], entry[2], entry[3])
+        if digest in cached:
+            valid.append(digest)
+        else:
+            pending.append((digest, entry))
+
+    # Çok thread'li süreçten fork kilitlenmeye yol açabilir; process pool yalnızca
+    # ana thread'den (publish_all doğrulamayı orada yapar) kullanılır
+    if len(pending) > PARALLEL_THRESHOLD and threading.current_thread() is threading.main_thread():
+        chunks = [
+            [entry for _, entry in pending[i:i + PARALLEL_CHUNK_SIZE]]
+            for i in range(0, len(pending), PARALLEL_CHUNK_SIZE)
+        ]
+        with ProcessPoolExecutor(initializer=_init_worker, initargs=(schema_path,)) as pool:
+            results = [result for chunk in pool.map(_validate_chunk, chunks) for result in chunk]
+    else:
+        results = [(entry, schema.validate_value(entry[0], entry[2], entry[3])) for _, entry in pending]
+
+    errors = []
+    for (digest, _), (entry, error) in zip(pending, results):
+        if error:
+            errors.append((entry[0], entry[1], error))
+        else:
+            valid.append(digest)
+
+    if cache_path:
+        with _cache_lock:
+            # Bu arada başka bir doğrulamanın kaydettiği hash'ler kaybolmasın
+            _save_cache(cache_path, _load_cache(cache_path), dict.fromkeys(valid))
+
+    return errors
+
+
+def print_errors(errors):
+    """Doğrulama hatalarını yazdır"""
+    print(f'❌ {len(errors)} geçersiz değer bulundu:')
+    for key, condition, error in errors:
+        location = f'{key} [{condition}]' if condition else key
+        print(f'   - {location}: {error}')
+
+
+def main():
+    if len(sys.argv) < 2:
+        print('Kullanım: python3 remote_config_validation.py <template.json> [...]')
+        sys.exit(1)
+
+    failed = False
+    for path in sys.argv[1:]:
+        print(f'🔍 {path} doğrulanıyor...')
+        errors = validate_template(load_template(path))
+        if errors:
+            print_errors(errors)
+            failed = True
+        else:
+            print('✅ Tüm değerler geçerli')
+        print()
+
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
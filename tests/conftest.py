@@ -0,0 +1,21 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+import remote_config_http  # noqa: E402
+import remote_config_publish  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def isolated_state(tmp_path, monkeypatch):
+    """Paylaşılan HTTP session'ını ve yerel önbellekleri test başına ayır"""
+    import remote_config_validation
+
+    monkeypatch.setattr(remote_config_publish, 'RETRY_BACKOFF_SECONDS', 0)
+    monkeypatch.setattr(remote_config_validation, 'CACHE_PATH', tmp_path / 'validation_cache.json')
+    yield
+    remote_config_http.use_session(None)
@@ -0,0 +1,88 @@
+import json
+import time
+
+import pytest
+
+import remote_config_catalog as catalog
+from remote_config_model import Template
+
+UPDATE_TIME = '2024-05-01T10:20:30.123456Z'
+
+
+def template(values, update_time=UPDATE_TIME):
+    return {
+        'parameters': {key: {'defaultValue': {'value': value}} for key, value in values.items()},
+        'version': {'versionNumber': '1', 'updateTime': update_time},
+    }
+
+
+def write(tmp_path, name, data):
+    path = tmp_path / name
+    path.write_text(json.dumps(data), encoding='utf-8')
+    return path
+
+
+@pytest.fixture
+def connection():
+    connection = catalog.connect(':memory:')
+    yield connection
+    connection.close()
+
+
+def test_first_ingest_stores_values_without_history(connection, tmp_path):
+    path = write(tmp_path, 'local.json', template({'point_referral': '100', 'notification_start_hour': '9'}))
+
+    assert catalog.ingest_file(connection, 'local', path) == (2, 0, 0)
+
+    assert catalog.key_values(connection, 'point_referral') == {'': {'local': '100'}}
+    assert catalog.changes_since(connection, 'local', 0) == []
+
+
+def test_file_changes_are_dated_at_ingest_time(connection, tmp_path):
+    catalog.ingest_file(connection, 'local', write(tmp_path, 'v1.json', template({'a': '1', 'b': '2'})))
+    before = time.time()
+
+    counts = catalog.ingest_file(connection, 'local', write(tmp_path, 'v2.json', template({'a': '5', 'c': '3'})))
+
+    assert counts == (1, 1, 1)
+    changes = catalog.changes_since(connection, 'local', 0)
+    assert [change[:4] for change in changes] == [('a', '', '1', '5'), ('b', '', '2', None), ('c', '', None, '3')]
+    assert all(change[4] >= before for change in changes)
+
+
+def test_refresh_dates_fetched_changes_and_isolates_failures(connection, monkeypatch):
+    remote = {'prod-project': template({'a': '1'})}
+
+    def fetch_template(project_id, access_token, etag=None):
+        if project_id == 'broken-project':
+            raise RuntimeError('broken-project: HTTP 403')
+        data = remote[project_id]
+        new_etag = f'etag-{data["parameters"]["a"]["defaultValue"]["value"]}'
+        if etag == new_etag:
+            return None, etag
+        return Template.from_json(data), new_etag
+
+    monkeypatch.setattr(catalog, 'fetch_template', fetch_template)
+    environments = {'prod': 'prod-project', 'staging': 'broken-project'}
+
+    results = catalog.refresh(connection, 'token', environments)
+    assert results['prod'] == (1, 0, 0)
+    assert isinstance(results['staging'], RuntimeError)
+
+    assert catalog.refresh(connection, 'token', environments)['prod'] is None
+
+    remote['prod-project'] = template({'a': '2'}, update_time='2024-06-01T00:00:00Z')
+    assert catalog.refresh(connection, 'token', environments)['prod'] == (0, 0, 1)
+    assert catalog.changes_since(connection, 'prod', 0) == [
+        ('a', '', '1', '2', catalog._timestamp('2024-06-01T00:00:00Z')),
+    ]
+
+
+def test_drift_matrix_reports_different_and_missing_values(connection, tmp_path):
+    catalog.ingest_file(connection, 'prod', write(tmp_path, 'prod.json', template({'a': '1', 'b': '2', 'c': '3'})))
+    catalog.ingest_file(connection, 'staging', write(tmp_path, 'staging.json', template({'a': '1', 'b': '9'})))
+
+    envs, matrix = catalog.drift_matrix(connection)
+
+    assert envs == ['prod', 'staging']
+    assert matrix == {('b', ''): {'prod': '2', 'staging': '9'}, ('c', ''): {'prod': '3'}}
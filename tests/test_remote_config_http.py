@@ -0,0 +1,71 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+import pytest
+import requests
+
+import remote_config_http
+import remote_config_publish
+from conftest import ROOT
+
+PROJECT_ID = 'qanta-de0b9'
+TEMPLATE = (ROOT / 'remote_config_current.json').read_bytes()
+
+
+class FakeRemoteConfig(BaseHTTPRequestHandler):
+    def _reply(self, body, headers=()):
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json; charset=UTF-8')
+        for name, value in headers:
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        self._reply(TEMPLATE, [('ETag', 'etag-1')])
+
+    def do_PUT(self):
+        self.rfile.read(int(self.headers['Content-Length']))
+        self._reply(json.dumps({'version': {'versionNumber': '2'}}).encode('utf-8'))
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def cassette(tmp_path, monkeypatch):
+    """Gerçek proje ID'siyle yerel sunucuya karşı kaydedilmiş cassette"""
+    server = HTTPServer(('127.0.0.1', 0), FakeRemoteConfig)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    monkeypatch.setattr(remote_config_publish, 'API_ROOT', f'http://127.0.0.1:{server.server_port}/v1')
+
+    path = tmp_path / 'cassette.jsonl'
+    remote_config_http.use_session(remote_config_http.create_session('record', path))
+    try:
+        template, etag = remote_config_publish.get_current_template(PROJECT_ID, 'secret-token')
+        assert remote_config_publish.deploy_template(PROJECT_ID, 'secret-token', template, etag)
+    finally:
+        server.shutdown()
+        server.server_close()
+    return path
+
+
+def test_recording_redacts_token(cassette):
+    text = cassette.read_text(encoding='utf-8')
+    assert 'secret-token' not in text
+    assert f'/v1/projects/{PROJECT_ID}/remoteConfig' in text
+
+
+def test_bench_replays_recording_of_real_project(cassette):
+    assert remote_config_http.cassette_project(cassette) == PROJECT_ID
+
+    result = remote_config_http.bench(cassette, ROOT / 'remote_config_merged.json', runs=3, speed=0)
+
+    assert result['runs'] == 3
+    assert result['max_ms'] >= result['p50_ms'] > 0
+
+
+def test_bench_with_other_project_does_not_match(cassette):
+    with pytest.raises(requests.ConnectionError):
+        remote_config_http.bench(cassette, ROOT / 'remote_config_merged.json', runs=1, speed=0, project_id='bench')
@@ -0,0 +1,46 @@
+from remote_config_metrics import connect, export_prometheus
+
+NOW = 1_000_000.0
+DAY = 86400
+
+
+def add_run(connection, started_at, duration_ms, retries, outcome='success'):
+    run_id = connection.execute(
+        'INSERT INTO runs (script, project, started_at, duration_ms, outcome) VALUES (?, ?, ?, ?, ?)',
+        ('deploy', 'qanta', started_at, duration_ms, outcome),
+    ).lastrowid
+    connection.execute(
+        'INSERT INTO phases (run_id, phase, duration_ms, payload_bytes, retries) VALUES (?, ?, ?, ?, ?)',
+        (run_id, 'publish', duration_ms, None, retries),
+    )
+
+
+def export(tmp_path, since):
+    connection = connect(tmp_path / 'metrics.db')
+    add_run(connection, NOW - 30 * DAY, 9000, 2, outcome='error')
+    add_run(connection, NOW - DAY, 1000, 1)
+    output = tmp_path / 'remote_config.prom'
+    export_prometheus(connection, output, since=since)
+    samples = {}
+    for line in output.read_text(encoding='utf-8').splitlines():
+        if not line.startswith('#'):
+            name, value = line.rsplit(' ', 1)
+            samples[name] = float(value)
+    return samples
+
+
+def test_days_window_applies_only_to_quantiles(tmp_path):
+    samples = export(tmp_path, since=NOW - 7 * DAY)
+    labels = 'project="qanta",phase="publish"'
+
+    assert samples[f'remote_config_deploy_phase_duration_seconds{{{labels},quantile="0.99"}}'] == 1.0
+    assert samples[f'remote_config_deploy_phase_duration_seconds_sum{{{labels}}}'] == 10.0
+    assert samples[f'remote_config_deploy_phase_duration_seconds_count{{{labels}}}'] == 2
+    assert samples[f'remote_config_deploy_phase_retries_total{{{labels}}}'] == 3
+    assert samples['remote_config_deploy_runs_total{project="qanta",outcome="error"}'] == 1
+
+
+def test_without_window_quantiles_cover_all_runs(tmp_path):
+    samples = export(tmp_path, since=None)
+
+    assert samples['remote_config_deploy_phase_duration_seconds{project="qanta",phase="publish",quantile="0.99"}'] == 9.0
@@ -0,0 +1,26 @@
+import pytest
+
+from conftest import ROOT
+from remote_config_loader import iter_template, json_dumps, json_loads, load_template
+from remote_config_model import Template, json_default
+
+
+def round_trip(template):
+    return json_loads(json_dumps(template, default=json_default))
+
+
+def test_template_round_trips_without_changes():
+    data = load_template(ROOT / 'remote_config_merged.json')
+
+    assert round_trip(Template.from_json(data)) == data
+
+
+def test_streamed_template_matches_full_load():
+    path = ROOT / 'remote_config_merged.json'
+
+    assert round_trip(Template.from_items(iter_template(path))) == load_template(path)
+
+
+@pytest.mark.parametrize('data', [{'version': {'versionNumber': '3'}}, {'parameters': {}}])
+def test_parameters_key_only_when_present(data):
+    assert round_trip(Template.from_json(data)) == data
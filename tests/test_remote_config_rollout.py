@@ -0,0 +1,161 @@
+import pytest
+
+import remote_config_rollout as rollout
+from conftest import ROOT
+from remote_config_loader import load_template
+from remote_config_metrics import DeployMetrics
+from remote_config_model import Template
+
+KEY = 'point_referral'
+NEW_VALUE = '150'
+
+
+class FakeRemoteConfig:
+    """ETag kontrolü yapan bellek içi Remote Config
+
+    fail_publishes'taki sıra numaralı (0'dan başlayan) yüklemeler reddedilir.
+    """
+
+    def __init__(self, template):
+        self.template = template
+        self.version = 1
+        self.published = []
+        self.attempts = 0
+        self.fail_publishes = set()
+
+    def get_current_template(self, project_id, access_token, metrics=None):
+        return self.template, f'etag-{self.version}'
+
+    def deploy_template(self, project_id, access_token, template, etag, metrics=None):
+        attempt = self.attempts
+        self.attempts += 1
+        if attempt in self.fail_publishes:
+            return None
+        assert etag == f'etag-{self.version}'
+        self.version += 1
+        self.template = template
+        self.published.append(template.version['description'])
+        return {'version': {'versionNumber': str(self.version)}}
+
+
+@pytest.fixture
+def remote(monkeypatch):
+    fake = FakeRemoteConfig(Template.from_json(load_template(ROOT / 'remote_config_merged.json')))
+    monkeypatch.setattr(rollout, 'get_current_template', fake.get_current_template)
+    monkeypatch.setattr(rollout, 'deploy_template', fake.deploy_template)
+    return fake
+
+
+def run(probe):
+    metrics = DeployMetrics('test', path=':memory:')
+    return rollout.run_rollout(
+        'project', 'token', KEY, NEW_VALUE, probe, metrics,
+        interval=0, max_latency_ms=500, max_error_rate=0.05, sleep=lambda seconds: None,
+    )
+
+
+def assert_untouched(remote, original):
+    assert remote.template.parameters[KEY] == original
+    assert not any(c.name == rollout.condition_name(KEY) for c in remote.template.conditions or ())
+
+
+def test_healthy_rollout_reaches_100_percent(remote):
+    probe = rollout.StaticProbe([rollout.HealthSample(120, 0.01)])
+
+    assert run(probe) == 'success'
+
+    assert remote.published == [
+        f'Rollout: {KEY} %1', f'Rollout: {KEY} %10', f'Rollout: {KEY} %50', f'Rollout tamamlandı: {KEY}',
+    ]
+    param = remote.template.parameters[KEY]
+    assert param.default_value.value == NEW_VALUE
+    assert param.conditional_values is None
+    assert remote.template.conditions is None
+
+
+def test_intermediate_step_uses_percent_condition(remote):
+    template = rollout.with_rollout(remote.template, KEY, NEW_VALUE, 10)
+
+    condition = template.conditions[0]
+    assert condition.name == rollout.condition_name(KEY)
+    assert condition.expression == f"percent('{KEY}') <= 10"
+    assert template.parameters[KEY].conditional_values[condition.name].value == NEW_VALUE
+
+
+def test_threshold_breach_rolls_back(remote):
+    original = remote.template.parameters[KEY]
+    probe = rollout.StaticProbe([rollout.HealthSample(120, 0.01), rollout.HealthSample(900, 0.01)])
+
+    assert run(probe) == 'rolled_back'
+
+    assert remote.published[-1] == f'Rollout geri alındı: {KEY}'
+    assert len(remote.published) == 3
+    assert_untouched(remote, original)
+
+
+def test_probe_error_rolls_back(remote):
+    original = remote.template.parameters[KEY]
+
+    class BrokenProbe:
+        def check(self, key, percent):
+            raise TimeoutError('monitoring unreachable')
+
+    assert run(BrokenProbe()) == 'rolled_back'
+
+    assert remote.published == [f'Rollout: {KEY} %1', f'Rollout geri alındı: {KEY}']
+    assert_untouched(remote, original)
+
+
+def test_failed_later_step_rolls_back(remote):
+    original = remote.template.parameters[KEY]
+    # %10 adımının yüklemesi (ör: 412 çakışması) reddedilir
+    remote.fail_publishes = {1}
+    probe = rollout.StaticProbe([rollout.HealthSample(120, 0.01)])
+
+    assert run(probe) == 'rolled_back'
+
+    assert remote.published == [f'Rollout: {KEY} %1', f'Rollout geri alındı: {KEY}']
+    assert_untouched(remote, original)
+
+
+def test_failed_first_step_leaves_nothing_to_roll_back(remote):
+    original = remote.template.parameters[KEY]
+    remote.fail_publishes = {0}
+    probe = rollout.StaticProbe([rollout.HealthSample(120, 0.01)])
+
+    assert run(probe) == 'error'
+
+    assert remote.published == []
+    assert_untouched(remote, original)
+
+
+def test_missing_key_fails_before_first_step(remote, capsys):
+    metrics = DeployMetrics('test', path=':memory:')
+    probe = rollout.StaticProbe([rollout.HealthSample(120, 0.01)])
+
+    outcome = rollout.run_rollout(
+        'project', 'token', 'no_such_key', NEW_VALUE, probe, metrics,
+        interval=0, max_latency_ms=500, sleep=lambda seconds: None,
+    )
+
+    assert outcome == 'error'
+    assert remote.published == []
+    assert 'no_such_key' in capsys.readouterr().out
+
+
+def test_rollback_ignores_invalid_console_edit(remote):
+    original = remote.template.parameters[KEY]
+
+    class ConsoleEditProbe:
+        """İlk adımdan sonra biri Console'dan geçersiz bir değer yayınlar"""
+
+        def check(self, key, percent):
+            hours = remote.template.parameters['notification_hours']
+            edited = hours.replace(default_value=hours.default_value.replace(value='9,25'))
+            remote.template = remote.template.with_parameters({'notification_hours': edited})
+            return rollout.HealthSample(900, 0.01)
+
+    assert run(ConsoleEditProbe()) == 'rolled_back'
+
+    assert remote.published == [f'Rollout: {KEY} %1', f'Rollout geri alındı: {KEY}']
+    assert_untouched(remote, original)
@@ -0,0 +1,97 @@
+import pytest
+
+import remote_config_publish
+import remote_config_usage as usage
+from remote_config_model import Template
+
+SERVICE = '''
+class RemoteConfigService {
+  FirebaseRemoteConfig? _remoteConfig;
+
+  Future<void> initialize() async {
+    await _remoteConfig!.fetchAndActivate();
+  }
+
+  bool get isReferralEnabled => _remoteConfig!.getBool('referral_enabled');
+
+  int get dailyLimit {
+    return _remoteConfig?.getInt('daily_limit') ?? 4;
+  }
+
+  set debugLimit(int value) {
+    _debug = value;
+  }
+
+  int getUnusedValue() {
+    return _remoteConfig?.getInt('unused_value') ?? 0;
+  }
+
+  final bannerText = FirebaseRemoteConfig.instance.getString('banner_text');
+}
+'''
+
+
+def build(tmp_path, source=SERVICE):
+    (tmp_path / 'service.dart').write_text(source, encoding='utf-8')
+    return usage.build_index(tmp_path, cache_path=None)
+
+
+def template(*keys):
+    return Template.from_json({
+        'parameters': {key: {'defaultValue': {'value': '1'}} for key in keys},
+    })
+
+
+def test_getter_reads_are_not_credited_to_the_method_above(tmp_path):
+    index = build(tmp_path)
+
+    assert index.reads['referral_enabled'][0][2] is None
+    assert index.reads['daily_limit'][0][2] is None
+    assert index.reads['unused_value'][0][2] == 'getUnusedValue'
+    assert 'debugLimit' not in index.calls
+
+
+def test_reads_outside_any_method_count_as_live(tmp_path):
+    index = build(tmp_path)
+
+    assert index.reads['banner_text'][0][2] is None
+    assert index.dead_parameters(template('referral_enabled', 'daily_limit', 'banner_text', 'unused_value')) == [
+        'unused_value',
+    ]
+
+
+@pytest.fixture
+def live(monkeypatch):
+    state = {'template': template('daily_limit', 'unused_value'), 'deployed': []}
+
+    def get_current_template(project_id, access_token, metrics=None):
+        return state['template'], 'etag-1'
+
+    def deploy_template(project_id, access_token, template, etag, metrics=None):
+        state['deployed'].append(template)
+        return {}
+
+    monkeypatch.setattr(remote_config_publish, 'get_current_template', get_current_template)
+    monkeypatch.setattr(remote_config_publish, 'deploy_template', deploy_template)
+    return state
+
+
+def test_publish_lists_keys_and_stops_when_not_confirmed(tmp_path, live, capsys):
+    index = build(tmp_path)
+    asked = []
+
+    removed = usage.publish_pruned('project', 'token', index, confirm=lambda dead: asked.append(dead))
+
+    assert removed == []
+    assert asked == [['unused_value']]
+    assert live['deployed'] == []
+    assert '- unused_value' in capsys.readouterr().out
+
+
+def test_publish_deploys_after_confirmation(tmp_path, live):
+    index = build(tmp_path)
+
+    removed = usage.publish_pruned('project', 'token', index, confirm=lambda dead: True)
+
+    assert removed == ['unused_value']
+    assert list(live['deployed'][0].parameters) == ['daily_limit']
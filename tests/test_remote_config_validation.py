@@ -0,0 +1,19 @@
+import pytest
+
+from remote_config_validation import _compile_constraints
+
+INTEGER_HOURS = {'integer': True, 'min': 0, 'max': 23}
+
+
+@pytest.mark.parametrize('value', ['0', '7', '+7', ' 7 ', '23'])
+def test_integer_rule_accepts_int_parse_values(value):
+    assert _compile_constraints(INTEGER_HOURS)(value) is None
+
+
+@pytest.mark.parametrize('value', ['5.0', '1e1', '1_0', '٣', '0x1', ''])
+def test_integer_rule_rejects_non_integer_text(value):
+    assert _compile_constraints(INTEGER_HOURS)(value).startswith('tam sayı değil')
+
+
+def test_integer_rule_checks_range_after_format():
+    assert _compile_constraints(INTEGER_HOURS)('24') == '24 > 23'